@@ -3,7 +3,12 @@ Technical Indicators Calculation Module
 """
 
 from .moving_average import calculate_ma, calculate_ma_dict
-from .bollinger_bands import calculate_bollinger_bands, calculate_bollinger_bands_dict
+from .bollinger_bands import (
+    calculate_bollinger_bands,
+    calculate_bollinger_bands_dict,
+    calculate_ma_and_bb,
+    calculate_bb_batch
+)
 from .vwap import calculate_vwap, calculate_vwap_dict
 
 __all__ = [
@@ -11,6 +16,8 @@ __all__ = [
     'calculate_ma_dict',
     'calculate_bollinger_bands',
     'calculate_bollinger_bands_dict',
+    'calculate_ma_and_bb',
+    'calculate_bb_batch',
     'calculate_vwap',
     'calculate_vwap_dict'
 ]
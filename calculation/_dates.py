@@ -0,0 +1,22 @@
+"""
+Date Formatting Helpers
+Shared by the indicator *_dict functions
+"""
+
+import pandas as pd
+from typing import List
+
+
+def format_dates(dates: pd.Series) -> List[str]:
+    """
+    Format a date column as 'YYYY-MM-DD' strings in one vectorized pass
+    
+    Args:
+        dates: Series of dates (datetime64 or arbitrary objects)
+    
+    Returns:
+        List of date strings; non-datetime values use strftime when available, else str()
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates.dt.strftime('%Y-%m-%d').tolist()
+    return [d.strftime('%Y-%m-%d') if hasattr(d, 'strftime') else str(d) for d in dates]
@@ -0,0 +1,28 @@
+"""
+Optional Numba Support
+Provides njit/prange when numba is installed, and pass-through fallbacks otherwise
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for numba.njit
+
+        Supports both bare @njit and @njit(...) usage.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'HAS_NUMBA']
@@ -5,15 +5,21 @@ Calculates Upper Band, Middle Band (SMA), and Lower Band
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Union
+
+from ._dates import format_dates
+from .moving_average import calculate_ma
+from ._njit import njit, prange, HAS_NUMBA
 
 
 def calculate_bollinger_bands(
     data: pd.DataFrame,
     period: int = 20,
     num_std: float = 2.0,
-    column: str = 'close'
-) -> Dict[str, List[float]]:
+    column: str = 'close',
+    as_array: bool = False,
+    dtype: np.dtype = np.float64
+) -> Dict[str, Union[List[float], np.ndarray]]:
     """
     Calculate Bollinger Bands
     
@@ -22,22 +28,32 @@ def calculate_bollinger_bands(
         period: Number of periods for moving average (default: 20)
         num_std: Number of standard deviations (default: 2.0)
         column: Column to calculate on (default: 'close')
+        as_array: If True, return NumPy arrays instead of lists
+        dtype: Output float dtype, e.g. np.float32 (statistics are accumulated in float64)
     
     Returns:
-        Dictionary with 'upper', 'middle', 'lower' bands as lists
+        Dictionary with 'upper', 'middle', 'lower' bands as lists (or arrays)
     """
     if column not in data.columns:
         raise ValueError(f"Column '{column}' not found in data")
     
-    # Calculate middle band (SMA)
-    middle = data[column].rolling(window=period, min_periods=1).mean()
+    values = data[column].to_numpy(dtype=dtype)
     
-    # Calculate standard deviation
-    std = data[column].rolling(window=period, min_periods=1).std()
+    if HAS_NUMBA:
+        upper, middle, lower = _bb_kernel(values, period, num_std)
+    else:
+        middle, std = _rolling_mean_std(values.astype(np.float64, copy=False), period)
+        
+        # Calculate upper and lower bands
+        upper = middle + (std * num_std)
+        lower = middle - (std * num_std)
+        
+        upper = upper.astype(dtype, copy=False)
+        middle = middle.astype(dtype, copy=False)
+        lower = lower.astype(dtype, copy=False)
     
-    # Calculate upper and lower bands
-    upper = middle + (std * num_std)
-    lower = middle - (std * num_std)
+    if as_array:
+        return {'upper': upper, 'middle': middle, 'lower': lower}
     
     return {
         'upper': upper.tolist(),
@@ -46,6 +62,226 @@ def calculate_bollinger_bands(
     }
 
 
+def calculate_ma_and_bb(
+    data: pd.DataFrame,
+    ma_period: int = 10,
+    bb_period: int = 20,
+    num_std: float = 2.0,
+    column: str = 'close',
+    as_array: bool = False,
+    dtype: np.dtype = np.float64
+) -> Dict[str, Union[List[float], np.ndarray]]:
+    """
+    Calculate the moving average and Bollinger Bands together
+    
+    When both use the same period the MA is the Bollinger middle band, so the
+    column is only scanned once; 'ma' is returned as a copy so callers can
+    modify either series independently.
+    
+    Args:
+        data: DataFrame with stock data
+        ma_period: Number of periods for the moving average (default: 10)
+        bb_period: Number of periods for Bollinger Bands (default: 20)
+        num_std: Number of standard deviations (default: 2.0)
+        column: Column to calculate on (default: 'close')
+        as_array: If True, return NumPy arrays instead of lists
+        dtype: Output float dtype, e.g. np.float32
+    
+    Returns:
+        Dictionary with 'ma', 'upper', 'middle', 'lower' as lists (or arrays)
+    """
+    bands = calculate_bollinger_bands(data, bb_period, num_std, column, as_array=as_array, dtype=dtype)
+    if ma_period == bb_period:
+        middle = bands['middle']
+        bands['ma'] = middle.copy() if as_array else list(middle)
+    else:
+        bands['ma'] = calculate_ma(data, ma_period, column, as_array=as_array, dtype=dtype)
+    return bands
+
+
+def _rolling_mean_std(values: np.ndarray, period: int) -> tuple:
+    """
+    Rolling mean and sample std from windowed running sums (NumPy-only fallback)
+    
+    Each window's sum, sum of squares and valid count are differences of
+    cumulative sums, so the cost is O(n) regardless of the period. Values are
+    shifted by the first valid value first, which keeps the sums small and
+    limits cancellation in the variance. NaNs are skipped like pandas
+    rolling(min_periods=1).
+    
+    Args:
+        values: 1-D float64 array
+        period: Window size
+    
+    Returns:
+        Tuple of (mean, std) float64 arrays
+    """
+    if len(values) == 0:
+        return np.empty(0), np.empty(0)
+    
+    valid = ~np.isnan(values)
+    shift = values[valid][0] if valid.any() else 0.0
+    centered = np.where(valid, values - shift, 0.0)
+    
+    cum_sum = np.concatenate(([0.0], np.cumsum(centered)))
+    cum_sq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    cum_count = np.concatenate(([0], np.cumsum(valid)))
+    
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - period, 0)
+    window_sum = cum_sum[ends] - cum_sum[starts]
+    window_sq = cum_sq[ends] - cum_sq[starts]
+    count = cum_count[ends] - cum_count[starts]
+    
+    mean = np.full(len(values), np.nan)
+    np.divide(window_sum, count, out=mean, where=count > 0)
+    
+    # Sum of squared deviations = sum(x^2) - sum(x) * mean, on shifted values
+    squared_dev = np.maximum(window_sq - window_sum * np.where(count > 0, mean, 0.0), 0.0)
+    std = np.full(len(values), np.nan)
+    np.divide(squared_dev, count - 1, out=std, where=count > 1)
+    np.sqrt(std, out=std)
+    
+    mean += shift
+    return mean, std
+
+
+@njit(cache=True)
+def _bb_kernel(values, period, num_std):
+    """
+    Rolling mean and sample std in a single pass (Welford add/remove updates)
+    
+    NaNs are skipped like pandas rolling(min_periods=1); std needs at least
+    two valid values in the window. Running statistics are float64; outputs
+    take the dtype of values.
+    
+    Args:
+        values: 1-D float array
+        period: Window size
+        num_std: Number of standard deviations
+    
+    Returns:
+        Tuple of (upper, middle, lower) arrays
+    """
+    n_values = values.shape[0]
+    upper = np.empty(n_values, dtype=values.dtype)
+    middle = np.empty(n_values, dtype=values.dtype)
+    lower = np.empty(n_values, dtype=values.dtype)
+    _bb_fill(values, period, num_std, upper, middle, lower)
+    return upper, middle, lower
+
+
+@njit(cache=True)
+def _bb_fill(values, period, num_std, upper, middle, lower):
+    """
+    Write Bollinger Bands for one series into preallocated output arrays
+    
+    See _bb_kernel for the semantics.
+    """
+    n_values = values.shape[0]
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n_values):
+        x = float(values[i])
+        if x == x:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        
+        if i >= period:
+            old = float(values[i - period])
+            if old == old:
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+        
+        if count == 0:
+            middle[i] = np.nan
+            upper[i] = np.nan
+            lower[i] = np.nan
+            continue
+        
+        middle[i] = mean
+        if count < 2:
+            upper[i] = np.nan
+            lower[i] = np.nan
+        else:
+            std = np.sqrt(max(m2, 0.0) / (count - 1))
+            upper[i] = mean + std * num_std
+            lower[i] = mean - std * num_std
+
+
+@njit(cache=True, parallel=True)
+def _bb_batch(values_2d, period, num_std, upper, middle, lower):
+    """
+    Run _bb_fill over each row of a 2-D array, spreading rows across threads
+    """
+    for i in prange(values_2d.shape[0]):
+        _bb_fill(values_2d[i], period, num_std, upper[i], middle[i], lower[i])
+
+
+def calculate_bb_batch(
+    arrays: List[np.ndarray],
+    period: int = 20,
+    num_std: float = 2.0
+) -> List[Dict[str, np.ndarray]]:
+    """
+    Calculate Bollinger Bands for several price series at once
+    
+    With numba the series are processed in parallel threads; shorter series are
+    front-padded with NaN, which the kernel skips, so padding does not change
+    their results.
+    
+    Args:
+        arrays: List of 1-D price arrays (e.g. close prices of several stocks)
+        period: Number of periods for moving average (default: 20)
+        num_std: Number of standard deviations (default: 2.0)
+    
+    Returns:
+        List of dicts with 'upper', 'middle', 'lower' arrays, in input order
+    """
+    arrays = [np.asarray(values, dtype=np.float64) for values in arrays]
+    if not arrays:
+        return []
+    
+    if not HAS_NUMBA:
+        results = []
+        for values in arrays:
+            middle, std = _rolling_mean_std(values, period)
+            results.append({
+                'upper': middle + (std * num_std),
+                'middle': middle,
+                'lower': middle - (std * num_std)
+            })
+        return results
+    
+    max_len = max(len(values) for values in arrays)
+    values_2d = np.full((len(arrays), max_len), np.nan)
+    for i, values in enumerate(arrays):
+        values_2d[i, max_len - len(values):] = values
+    
+    upper = np.empty_like(values_2d)
+    middle = np.empty_like(values_2d)
+    lower = np.empty_like(values_2d)
+    _bb_batch(values_2d, period, num_std, upper, middle, lower)
+    
+    return [
+        {
+            'upper': upper[i, max_len - len(values):],
+            'middle': middle[i, max_len - len(values):],
+            'lower': lower[i, max_len - len(values):]
+        }
+        for i, values in enumerate(arrays)
+    ]
+
+
 def calculate_bollinger_bands_dict(
     data: pd.DataFrame,
     period: int = 20,
@@ -64,14 +300,16 @@ def calculate_bollinger_bands_dict(
     """
     bands = calculate_bollinger_bands(data, period, num_std)
     
-    result = []
-    for idx, row in data.iterrows():
-        result.append({
-            'date': row['date'].strftime('%Y-%m-%d') if hasattr(row['date'], 'strftime') else str(row['date']),
-            'upper': float(bands['upper'][idx]) if not pd.isna(bands['upper'][idx]) else None,
-            'middle': float(bands['middle'][idx]) if not pd.isna(bands['middle'][idx]) else None,
-            'lower': float(bands['lower'][idx]) if not pd.isna(bands['lower'][idx]) else None
-        })
+    date_strs = format_dates(data['date'])
     
-    return result
+    # Missing bands (NaN != NaN) become None
+    return [
+        {
+            'date': date_str,
+            'upper': None if upper != upper else upper,
+            'middle': None if middle != middle else middle,
+            'lower': None if lower != lower else lower
+        }
+        for date_str, upper, middle, lower in zip(date_strs, bands['upper'], bands['middle'], bands['lower'])
+    ]
 
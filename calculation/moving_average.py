@@ -3,11 +3,21 @@ Moving Average Calculation
 Calculates Simple Moving Average (SMA) for stock data
 """
 
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Union
 
+from ._dates import format_dates
+from ._njit import njit, HAS_NUMBA
 
-def calculate_ma(data: pd.DataFrame, period: int = 10, column: str = 'close') -> List[float]:
+
+def calculate_ma(
+    data: pd.DataFrame,
+    period: int = 10,
+    column: str = 'close',
+    as_array: bool = False,
+    dtype: np.dtype = np.float64
+) -> Union[List[float], np.ndarray]:
     """
     Calculate Simple Moving Average (SMA)
     
@@ -15,15 +25,78 @@ def calculate_ma(data: pd.DataFrame, period: int = 10, column: str = 'close') ->
         data: DataFrame with stock data (must have 'close' column)
         period: Number of periods for moving average (default: 10)
         column: Column to calculate MA on (default: 'close')
+        as_array: If True, return a NumPy array instead of a list
+        dtype: Output float dtype, e.g. np.float32 (sums are always accumulated in float64)
     
     Returns:
-        List of MA values (NaN for first period-1 values)
+        List (or array) of MA values
     """
     if column not in data.columns:
         raise ValueError(f"Column '{column}' not found in data")
     
-    ma = data[column].rolling(window=period, min_periods=1).mean()
-    return ma.tolist()
+    if HAS_NUMBA:
+        ma = _ma_kernel(data[column].to_numpy(dtype=dtype), period)
+        return ma if as_array else ma.tolist()
+    
+    values = data[column].to_numpy(dtype=dtype).astype(np.float64, copy=False)
+    
+    # O(n) SMA from cumulative sums; NaNs are skipped and each window is
+    # averaged over its valid values, matching rolling(min_periods=1).mean()
+    valid = ~np.isnan(values)
+    cum_sum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    cum_count = np.concatenate(([0], np.cumsum(valid)))
+    
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - period, 0)
+    window_sum = cum_sum[ends] - cum_sum[starts]
+    window_count = cum_count[ends] - cum_count[starts]
+    
+    ma = np.full(len(values), np.nan)
+    np.divide(window_sum, window_count, out=ma, where=window_count > 0)
+    ma = ma.astype(dtype, copy=False)
+    return ma if as_array else ma.tolist()
+
+
+@njit(cache=True)
+def _ma_kernel(values, period):
+    """
+    Simple moving average in a single pass with a running window sum
+    
+    NaNs are skipped and each window is averaged over its valid values,
+    matching rolling(min_periods=1).mean(). The sum is float64; the output
+    takes the dtype of values.
+    
+    Args:
+        values: 1-D float array
+        period: Window size
+    
+    Returns:
+        Array of MA values (NaN where the window has no valid values)
+    """
+    n_values = values.shape[0]
+    out = np.empty(n_values, dtype=values.dtype)
+    window_sum = 0.0
+    count = 0
+    for i in range(n_values):
+        x = float(values[i])
+        if x == x:
+            window_sum += x
+            count += 1
+        
+        if i >= period:
+            old = float(values[i - period])
+            if old == old:
+                window_sum -= old
+                count -= 1
+                if count == 0:
+                    window_sum = 0.0
+        
+        if count == 0:
+            out[i] = np.nan
+        else:
+            out[i] = window_sum / count
+    
+    return out
 
 
 def calculate_ma_dict(data: pd.DataFrame, period: int = 10) -> List[Dict]:
@@ -39,12 +112,11 @@ def calculate_ma_dict(data: pd.DataFrame, period: int = 10) -> List[Dict]:
     """
     ma_values = calculate_ma(data, period)
     
-    result = []
-    for idx, row in data.iterrows():
-        result.append({
-            'date': row['date'].strftime('%Y-%m-%d') if hasattr(row['date'], 'strftime') else str(row['date']),
-            'ma': float(ma_values[idx]) if not pd.isna(ma_values[idx]) else None
-        })
+    date_strs = format_dates(data['date'])
     
-    return result
+    # ma_values holds plain floats, so NaN is caught by self-comparison
+    return [
+        {'date': date_str, 'ma': None if ma != ma else ma}
+        for date_str, ma in zip(date_strs, ma_values)
+    ]
 
@@ -3,11 +3,19 @@ Volume Weighted Average Price (VWAP) Calculation
 Calculates VWAP for each trading day
 """
 
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Union
 
+from ._dates import format_dates
+from ._njit import njit, HAS_NUMBA
 
-def calculate_vwap(data: pd.DataFrame) -> List[float]:
+
+def calculate_vwap(
+    data: pd.DataFrame,
+    as_array: bool = False,
+    dtype: np.dtype = np.float64
+) -> Union[List[float], np.ndarray]:
     """
     Calculate Volume Weighted Average Price (VWAP)
     VWAP = Sum(Price * Volume) / Sum(Volume)
@@ -16,15 +24,26 @@ def calculate_vwap(data: pd.DataFrame) -> List[float]:
     
     Args:
         data: DataFrame with 'high', 'low', 'close', 'volume' columns
+        as_array: If True, return a NumPy array instead of a list
+        dtype: Output float dtype, e.g. np.float32 (sums are always accumulated in float64)
     
     Returns:
-        List of VWAP values
+        List (or array) of VWAP values
     """
     required_columns = ['high', 'low', 'close', 'volume']
     for col in required_columns:
         if col not in data.columns:
             raise ValueError(f"Column '{col}' not found in data")
     
+    if HAS_NUMBA:
+        vwap = _vwap_kernel(
+            data['high'].to_numpy(dtype=dtype),
+            data['low'].to_numpy(dtype=dtype),
+            data['close'].to_numpy(dtype=dtype),
+            data['volume'].to_numpy(dtype=np.float64)
+        )
+        return vwap if as_array else vwap.tolist()
+    
     # Calculate typical price (HLC/3)
     typical_price = (data['high'] + data['low'] + data['close']) / 3.0
     
@@ -38,7 +57,6 @@ def calculate_vwap(data: pd.DataFrame) -> List[float]:
     # Calculate VWAP using vectorized operations
     # For days with zero cumulative volume, use typical price
     # Otherwise use standard VWAP formula: VWAP = Cumulative(PV) / Cumulative(Volume)
-    import numpy as np
     vwap = cumulative_pv / cumulative_volume.replace(0, np.nan)
     
     # Replace NaN values (where volume was 0) with typical price
@@ -51,7 +69,48 @@ def calculate_vwap(data: pd.DataFrame) -> List[float]:
     # Final fillna to ensure no NaN values remain
     vwap = vwap.fillna(typical_price)
     
-    return vwap.tolist()
+    vwap = vwap.to_numpy(dtype=dtype)
+    return vwap if as_array else vwap.tolist()
+
+
+@njit(cache=True)
+def _vwap_kernel(high, low, close, volume):
+    """
+    Cumulative VWAP in a single pass over the raw arrays
+    
+    NaN volumes count as 0; rows where the running VWAP is undefined
+    (zero cumulative volume, NaN or inf) fall back to the typical price.
+    
+    Args:
+        high, low, close, volume: 1-D float arrays
+    
+    Returns:
+        Array of VWAP values with the dtype of high (sums are float64)
+    """
+    n_values = high.shape[0]
+    out = np.empty(n_values, dtype=high.dtype)
+    cumulative_pv = 0.0
+    cumulative_volume = 0.0
+    for i in range(n_values):
+        typical_price = (float(high[i]) + float(low[i]) + float(close[i])) / 3.0
+        vol = volume[i]
+        if vol != vol:
+            vol = 0.0
+        # Like pandas cumsum, a NaN term is skipped for later rows but
+        # leaves this row's cumulative value undefined
+        pv = typical_price * vol
+        if pv == pv:
+            cumulative_pv += pv
+        cumulative_volume += vol
+        
+        value = np.nan
+        if pv == pv and cumulative_volume != 0.0:
+            value = cumulative_pv / cumulative_volume
+        if value != value or value == np.inf or value == -np.inf:
+            value = typical_price
+        out[i] = value
+    
+    return out
 
 
 def calculate_vwap_dict(data: pd.DataFrame) -> List[Dict]:
@@ -66,13 +125,11 @@ def calculate_vwap_dict(data: pd.DataFrame) -> List[Dict]:
     """
     vwap_values = calculate_vwap(data)
     
-    result = []
-    for i, (idx, row) in enumerate(data.iterrows()):
-        vwap_val = vwap_values[i]
-        result.append({
-            'date': row['date'].strftime('%Y-%m-%d') if hasattr(row['date'], 'strftime') else str(row['date']),
-            'vwap': float(vwap_val) if vwap_val is not None and not pd.isna(vwap_val) else None
-        })
+    date_strs = format_dates(data['date'])
     
-    return result
+    # NaN is the only float not equal to itself
+    return [
+        {'date': date_str, 'vwap': None if vwap_val != vwap_val else vwap_val}
+        for date_str, vwap_val in zip(date_strs, vwap_values)
+    ]
 
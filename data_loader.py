@@ -5,11 +5,63 @@ Specifically designed for stock data with OHLCV (Open, High, Low, Close, Volume)
 """
 
 import pandas as pd
+import hashlib
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Union
 import warnings
 
+# Column order of normalized stock data
+STOCK_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
+# Accepted source column names for each stock column, in order of preference
+STOCK_COLUMN_ALIASES = {
+    'date': ('date', 'datetime', 'time', 'timestamp', 'dt'),
+    'open': ('open', 'o'),
+    'high': ('high', 'h'),
+    'low': ('low', 'l'),
+    'close': ('close', 'c', 'closing'),
+    'volume': ('volume', 'vol', 'v')
+}
+
+# Bump when normalization changes so stale Parquet cache entries are not reused
+LOADER_CACHE_VERSION = 1
+
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Prefer the Rust-based calamine reader for .xlsx when installed; pandas only
+# accepts engine='calamine' from 2.2 on, so older versions stay on openpyxl
+_XLSX_ENGINE = 'openpyxl'
+if tuple(int(part) for part in pd.__version__.split('.')[:2] if part.isdigit()) >= (2, 2):
+    try:
+        import python_calamine  # noqa: F401
+        _XLSX_ENGINE = 'calamine'
+    except ImportError:
+        pass
+
+
+def fast_read_csv(path: Union[str, Path], **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file using pandas' multi-threaded pyarrow engine when available.
+    
+    Falls back to the default C engine if pyarrow is not installed.
+    
+    Args:
+        path: Path to the CSV file
+        **kwargs: Extra keyword arguments passed to pd.read_csv
+    
+    Returns:
+        DataFrame with the loaded data
+    """
+    if _HAS_PYARROW:
+        return pd.read_csv(path, engine='pyarrow', **kwargs)
+    return pd.read_csv(path, **kwargs)
+
 
 class ExcelDataLoader:
     """
@@ -17,14 +69,23 @@ class ExcelDataLoader:
     Supports .xlsx and .xls file formats.
     """
     
-    def __init__(self, data_directory: str = "data"):
+    def __init__(self, data_directory: str = "data", use_pyarrow: bool = False, use_cache: bool = True):
         """
         Initialize the Excel Data Loader.
         
+        .xlsx files are read with python-calamine when it is installed,
+        otherwise with openpyxl; .xls files use xlrd.
+        
         Args:
             data_directory: Path to the directory containing Excel files (default: "data")
+            use_pyarrow: If True, read CSV files with the pyarrow engine when installed
+            use_cache: If True, keep normalized stock data as Parquet files in
+                       <data_directory>/.cache (requires pyarrow)
         """
         self.data_directory = Path(data_directory)
+        self.use_pyarrow = use_pyarrow
+        self.use_cache = use_cache and _HAS_PYARROW
+        self.cache_directory = self.data_directory / ".cache"
         self.data_directory.mkdir(exist_ok=True)
     
     def load_excel_file(
@@ -63,6 +124,16 @@ class ExcelDataLoader:
                 raise FileNotFoundError(f"Excel file not found: {filename}")
         
         try:
+            engine = _XLSX_ENGINE if str(file_path).endswith('.xlsx') else 'xlrd'
+            
+            if isinstance(sheet_name, list):
+                # Open the workbook once and parse each requested sheet from it
+                with pd.ExcelFile(file_path, engine=engine) as excel_file:
+                    return {
+                        name: excel_file.parse(name, header=header, skiprows=skiprows, usecols=usecols)
+                        for name in sheet_name
+                    }
+            
             # Load Excel file
             df = pd.read_excel(
                 file_path,
@@ -70,7 +141,7 @@ class ExcelDataLoader:
                 header=header,
                 skiprows=skiprows,
                 usecols=usecols,
-                engine='openpyxl' if str(file_path).endswith('.xlsx') else 'xlrd'
+                engine=engine
             )
             
             return df
@@ -134,21 +205,21 @@ class ExcelDataLoader:
             raise FileNotFoundError(f"Excel file not found: {filename}")
         
         try:
-            excel_file = pd.ExcelFile(file_path, engine='openpyxl' if str(file_path).endswith('.xlsx') else 'xlrd')
-            
-            info = {
-                'filename': filename,
-                'sheet_names': excel_file.sheet_names,
-                'num_sheets': len(excel_file.sheet_names),
-                'sheets_info': {}
-            }
-            
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, nrows=0)
-                info['sheets_info'][sheet_name] = {
-                    'columns': list(df.columns),
-                    'num_columns': len(df.columns)
+            with pd.ExcelFile(file_path, engine=_XLSX_ENGINE if str(file_path).endswith('.xlsx') else 'xlrd') as excel_file:
+                info = {
+                    'filename': filename,
+                    'sheet_names': excel_file.sheet_names,
+                    'num_sheets': len(excel_file.sheet_names),
+                    'sheets_info': {}
                 }
+                
+                # Parse headers from the already opened workbook
+                for sheet_name in excel_file.sheet_names:
+                    df = excel_file.parse(sheet_name, nrows=0)
+                    info['sheets_info'][sheet_name] = {
+                        'columns': list(df.columns),
+                        'num_columns': len(df.columns)
+                    }
             
             return info
             
@@ -160,7 +231,8 @@ class ExcelDataLoader:
         filename: str,
         header: int = 0,
         skiprows: Optional[int] = None,
-        usecols: Optional[Union[str, List[int]]] = None
+        usecols: Optional[Union[str, List[Union[int, str]]]] = None,
+        dtype_map: Optional[Dict[str, str]] = None
     ) -> pd.DataFrame:
         """
         Load data from a CSV file.
@@ -170,6 +242,7 @@ class ExcelDataLoader:
             header: Row to use as column names (default: 0)
             skiprows: Number of rows to skip at the start
             usecols: Columns to read (by index or name)
+            dtype_map: Optional column -> dtype mapping applied while parsing
         
         Returns:
             DataFrame with the loaded data
@@ -185,11 +258,13 @@ class ExcelDataLoader:
         
         try:
             # Load CSV file
-            df = pd.read_csv(
+            read_csv = fast_read_csv if self.use_pyarrow else pd.read_csv
+            df = read_csv(
                 file_path,
                 header=header,
                 skiprows=skiprows,
-                usecols=usecols
+                usecols=usecols,
+                dtype=dtype_map
             )
             
             return df
@@ -205,10 +280,10 @@ class ExcelDataLoader:
         normalize_column_names: bool = True
     ) -> pd.DataFrame:
         """
-        Load stock data from Excel or CSV file with required columns: date, open, high, low, close, volume.
+        Load stock data from Excel, CSV or Parquet file with required columns: date, open, high, low, close, volume.
         
         Args:
-            filename: Name of the Excel or CSV file
+            filename: Name of the Excel, CSV or Parquet file
             sheet_name: Name or index of sheet to load (default: first sheet, only for Excel)
             date_column: Name of the date column (auto-detected if None)
             normalize_column_names: If True, converts column names to lowercase and strips whitespace
@@ -217,7 +292,7 @@ class ExcelDataLoader:
             DataFrame with columns: date, open, high, low, close, volume
             - Date column is converted to datetime
             - OHLCV columns are converted to numeric
-            - Data is sorted by date
+            - Data is sorted by date and indexed by a DatetimeIndex
         
         Raises:
             ValueError: If required columns are missing
@@ -232,71 +307,113 @@ class ExcelDataLoader:
         
         file_ext = file_path.suffix.lower()
         
+        # Reuse the normalized frame from a previous load of the same file
+        cache_path = None
+        if self.use_cache and file_ext in ['.csv', '.xlsx', '.xls']:
+            cache_path = self._cache_path(file_path, sheet_name, normalize_column_names)
+            if cache_path.exists():
+                try:
+                    return pd.read_parquet(cache_path)
+                except Exception:
+                    # Unreadable entry (e.g. truncated); drop it and re-parse the source
+                    cache_path.unlink(missing_ok=True)
+        
         if file_ext == '.csv':
             # Load CSV file
-            df = self.load_csv_file(str(file_path))
+            df = self._load_stock_csv(file_path)
         elif file_ext in ['.xlsx', '.xls']:
             # Load Excel file
-            df = self.load_excel_file(str(file_path), sheet_name=sheet_name)
+            df = self.load_excel_file(str(file_path), sheet_name=0 if sheet_name is None else sheet_name)
+        elif file_ext == '.parquet':
+            # Load previously normalized data
+            df = pd.read_parquet(file_path)
         else:
-            raise ValueError(f"Unsupported file format: {file_ext}. Supported: .csv, .xlsx, .xls")
+            raise ValueError(f"Unsupported file format: {file_ext}. Supported: .csv, .xlsx, .xls, .parquet")
         
-        # Normalize column names (lowercase, strip whitespace)
-        if normalize_column_names:
-            df.columns = df.columns.str.lower().str.strip()
+        stock_df = self._normalize_dataframe(df, normalize_column_names=normalize_column_names)
         
-        # Required stock data columns
-        required_columns = {
-            'date': ['date', 'datetime', 'time', 'timestamp', 'dt'],
-            'open': ['open', 'o'],
-            'high': ['high', 'h'],
-            'low': ['low', 'l'],
-            'close': ['close', 'c', 'closing'],
-            'volume': ['volume', 'vol', 'v']
-        }
-        
-        # Find matching columns (case-insensitive)
-        column_mapping = {}
-        available_columns = [str(col).lower().strip() for col in df.columns]
-        
-        for standard_name, possible_names in required_columns.items():
-            found = False
-            for col in df.columns:
-                col_lower = str(col).lower().strip()
-                if col_lower in possible_names or standard_name in col_lower:
-                    column_mapping[standard_name] = col
-                    found = True
-                    break
-            
-            if not found:
-                # Try exact match with normalized column
-                if standard_name in available_columns:
-                    idx = available_columns.index(standard_name)
-                    column_mapping[standard_name] = df.columns[idx]
-                    found = True
-            
-            if not found:
-                raise ValueError(
-                    f"Required column '{standard_name}' not found. "
-                    f"Available columns: {list(df.columns)}. "
-                    f"Looking for: {possible_names}"
-                )
+        if cache_path is not None:
+            # Write to a temporary file and rename so readers never see a partial entry
+            tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                stock_df.to_parquet(tmp_path, compression='zstd')
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                # Caching is best-effort; a read-only data directory is fine
+                tmp_path.unlink(missing_ok=True)
         
-        # Select and rename columns
-        stock_df = df[list(column_mapping.values())].copy()
-        stock_df.columns = list(column_mapping.keys())
+        return stock_df
+    
+    def _cache_path(
+        self,
+        file_path: Path,
+        sheet_name: Optional[Union[str, int]],
+        normalize_column_names: bool
+    ) -> Path:
+        """
+        Get the Parquet cache location for a source file.
         
-        # Convert date column to datetime
-        stock_df['date'] = pd.to_datetime(stock_df['date'], errors='coerce')
+        The key covers the file's absolute path, modification time and size,
+        so editing or replacing the file invalidates the cached copy. The
+        loader version and CSV engine are included too, since either can
+        change the resulting dtypes.
         
-        # Convert OHLCV columns to numeric
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_columns:
-            # For volume, remove commas before converting (handles "74,18,162" format)
-            if col == 'volume':
-                # Convert to string, remove commas, then to numeric
-                stock_df[col] = stock_df[col].astype(str).str.replace(',', '').str.replace(' ', '')
-            stock_df[col] = pd.to_numeric(stock_df[col], errors='coerce')
+        Args:
+            file_path: Path to the source CSV or Excel file
+            sheet_name: Sheet being loaded (only for Excel)
+            normalize_column_names: Normalization flag passed to load_stock_data
+        
+        Returns:
+            Path of the cached Parquet file
+        """
+        stat = file_path.stat()
+        key = (
+            f"v{LOADER_CACHE_VERSION}:{file_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:"
+            f"{sheet_name}:{normalize_column_names}:{self.use_pyarrow}"
+        )
+        digest = hashlib.blake2b(key.encode()).hexdigest()[:16]
+        return self.cache_directory / f"{digest}.parquet"
+    
+    @staticmethod
+    def _is_canonical(df: pd.DataFrame) -> bool:
+        """
+        Check whether a DataFrame already has the normalized stock schema.
+        
+        Args:
+            df: DataFrame to check
+        
+        Returns:
+            True if df has datetime 'date' and numeric OHLCV columns
+        """
+        if not set(STOCK_COLUMNS).issubset(df.columns):
+            return False
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            return False
+        return all(pd.api.types.is_numeric_dtype(df[col]) for col in STOCK_COLUMNS[1:])
+    
+    def _normalize_dataframe(self, df: pd.DataFrame, normalize_column_names: bool = True) -> pd.DataFrame:
+        """
+        Normalize raw stock data to columns: date, open, high, low, close, volume.
+        
+        Frames that already have the canonical schema skip column resolution
+        and type conversion.
+        
+        Args:
+            df: Raw DataFrame as read from the source file
+            normalize_column_names: If True, converts column names to lowercase and strips whitespace
+        
+        Returns:
+            DataFrame with columns: date, open, high, low, close, volume, sorted by date
+            and indexed by a DatetimeIndex of the dates
+        
+        Raises:
+            ValueError: If required columns are missing
+        """
+        if self._is_canonical(df):
+            stock_df = df[STOCK_COLUMNS]
+        else:
+            stock_df = self._coerce_stock_columns(df, normalize_column_names)
         
         # Remove rows with missing critical data
         initial_rows = len(stock_df)
@@ -311,21 +428,144 @@ class ExcelDataLoader:
         stock_df = stock_df.sort_values('date').reset_index(drop=True)
         
         # Reorder columns: date, open, high, low, close, volume
-        stock_df = stock_df[['date', 'open', 'high', 'low', 'close', 'volume']]
+        stock_df = stock_df[STOCK_COLUMNS]
+        
+        # Index by date for time-based selection; left unnamed so that 'date'
+        # still refers only to the column
+        stock_df.index = pd.DatetimeIndex(stock_df['date']).rename(None)
+        
+        return stock_df
+    
+    @staticmethod
+    def _resolve_stock_columns(columns) -> Dict[str, str]:
+        """
+        Match source column names to the standard stock columns.
+        
+        Args:
+            columns: Column names of the source data
+        
+        Returns:
+            Dictionary mapping date, open, high, low, close, volume to source column names
+        
+        Raises:
+            ValueError: If required columns are missing
+        """
+        # Find matching columns (case-insensitive), normalizing each name once
+        normalized_columns = {}
+        for col in columns:
+            normalized_columns.setdefault(str(col).lower().strip(), col)
+        
+        column_mapping = {}
+        for standard_name, possible_names in STOCK_COLUMN_ALIASES.items():
+            # Exact alias matches first, then any column containing the standard name
+            match = next(
+                (normalized_columns[name] for name in possible_names if name in normalized_columns),
+                None
+            )
+            if match is None:
+                match = next(
+                    (col for name, col in normalized_columns.items() if standard_name in name),
+                    None
+                )
+            
+            if match is None:
+                raise ValueError(
+                    f"Required column '{standard_name}' not found. "
+                    f"Available columns: {list(columns)}. "
+                    f"Looking for: {list(possible_names)}"
+                )
+            column_mapping[standard_name] = match
+        
+        return column_mapping
+    
+    def _load_stock_csv(self, file_path: Path) -> pd.DataFrame:
+        """
+        Load only the stock columns of a CSV file, with price columns parsed as float64.
+        
+        The header is read first to resolve the column names, so the parser skips
+        unused columns and does no type inference on prices. Volume is left to
+        _coerce_stock_columns, which handles thousands separators. Files whose
+        prices do not parse as numbers are read again without explicit dtypes.
+        
+        Args:
+            file_path: Path to the CSV file
+        
+        Returns:
+            DataFrame with the source columns for date, open, high, low, close, volume
+        """
+        try:
+            column_mapping = self._resolve_stock_columns(pd.read_csv(file_path, nrows=0).columns)
+        except ValueError:
+            # Unknown layout: read everything and let normalization report it
+            return self.load_csv_file(str(file_path))
+        
+        usecols = list(dict.fromkeys(column_mapping.values()))
+        dtype_map = {column_mapping[col]: 'float64' for col in ('open', 'high', 'low', 'close')}
+        try:
+            return self.load_csv_file(str(file_path), usecols=usecols, dtype_map=dtype_map)
+        except ValueError:
+            return self.load_csv_file(str(file_path), usecols=usecols)
+    
+    def _coerce_stock_columns(self, df: pd.DataFrame, normalize_column_names: bool = True) -> pd.DataFrame:
+        """
+        Resolve column aliases and convert stock columns to datetime/numeric types.
+        
+        Args:
+            df: Raw DataFrame as read from the source file
+            normalize_column_names: If True, converts column names to lowercase and strips whitespace
+        
+        Returns:
+            DataFrame with columns renamed to date, open, high, low, close, volume
+        
+        Raises:
+            ValueError: If required columns are missing
+        """
+        # Normalize column names (lowercase, strip whitespace)
+        if normalize_column_names:
+            df.columns = df.columns.str.lower().str.strip()
+        
+        column_mapping = self._resolve_stock_columns(df.columns)
+        
+        # Select and rename columns. set_axis returns a new frame (a full copy
+        # before pandas' Copy-on-Write, a lazy one with it), so assigning the
+        # converted columns below never writes back into df
+        stock_df = df[list(column_mapping.values())].set_axis(list(column_mapping.keys()), axis=1)
+        
+        # Convert date column to datetime
+        if not pd.api.types.is_datetime64_any_dtype(stock_df['date']):
+            stock_df['date'] = pd.to_datetime(stock_df['date'], errors='coerce', cache=True)
+        
+        # Convert OHLCV columns to numeric; columns the reader already parsed
+        # as numbers are left as they are
+        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
+        need_coerce = [col for col in numeric_columns if not pd.api.types.is_numeric_dtype(stock_df[col])]
+        for col in need_coerce:
+            # For volume, remove commas before converting (handles "74,18,162" format)
+            if col == 'volume':
+                # Convert to string, remove commas, then to numeric
+                stock_df[col] = stock_df[col].astype(str).str.replace(',', '').str.replace(' ', '')
+            stock_df[col] = pd.to_numeric(stock_df[col], errors='coerce')
         
         return stock_df
     
     def load_multiple_stocks(
         self,
         filenames: Optional[List[str]] = None,
-        sheet_name: Optional[Union[str, int]] = None
+        sheet_name: Optional[Union[str, int]] = None,
+        max_workers: Optional[int] = None
     ) -> Dict[str, pd.DataFrame]:
         """
         Load stock data from multiple Excel files.
         
+        Files are loaded one after another unless max_workers is greater than 1,
+        in which case they are spread over a process pool. Worker processes
+        re-import the calling module, so scripts that opt in must call this
+        from under an ``if __name__ == "__main__":`` guard.
+        
         Args:
             filenames: List of Excel file names. If None, loads all Excel files in data directory
             sheet_name: Name or index of sheet to load from each file (default: first sheet)
+            max_workers: Number of worker processes to use (default: None, load sequentially)
         
         Returns:
             Dictionary with stock symbols (from filenames) as keys and DataFrames as values
@@ -333,21 +573,67 @@ class ExcelDataLoader:
         if filenames is None:
             filenames = self.list_excel_files()
         
+        args = (str(self.data_directory), sheet_name, self.use_pyarrow, self.use_cache)
+        if max_workers is None or max_workers <= 1 or len(filenames) <= 1:
+            results = [_load_one(filename, *args) for filename in filenames]
+        else:
+            workers = min(len(filenames), max_workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_load_one, filename, *args) for filename in filenames]
+                results = [future.result() for future in futures]
+        
         stocks_data = {}
         
-        for filename in filenames:
-            try:
-                # Extract stock symbol from filename (remove extension)
-                stock_symbol = Path(filename).stem
-                stock_df = self.load_stock_data(filename, sheet_name=sheet_name)
-                stocks_data[stock_symbol] = stock_df
-            except Exception as e:
-                warnings.warn(f"Failed to load {filename}: {str(e)}", UserWarning)
+        for filename, (stock_df, error, caught) in zip(filenames, results):
+            # Re-emit warnings raised while loading in the worker
+            for category, message in caught:
+                warnings.warn(message, category)
+            
+            if error is not None:
+                warnings.warn(f"Failed to load {filename}: {error}", UserWarning)
                 continue
+            
+            # Extract stock symbol from filename (remove extension)
+            stock_symbol = Path(filename).stem
+            stocks_data[stock_symbol] = stock_df
         
         return stocks_data
 
 
+def _load_one(
+    filename: str,
+    data_directory: str,
+    sheet_name: Optional[Union[str, int]],
+    use_pyarrow: bool,
+    use_cache: bool
+) -> tuple:
+    """
+    Load a single stock file; module-level so it can run in a worker process.
+    
+    Args:
+        filename: Name of the stock data file
+        data_directory: Directory containing data files
+        sheet_name: Name or index of sheet to load (only for Excel)
+        use_pyarrow: If True, read CSV files with the pyarrow engine when installed
+        use_cache: If True, use the on-disk Parquet cache
+    
+    Returns:
+        Tuple of (DataFrame or None, error message or None, list of (category, message) warnings).
+        Errors are passed back as strings since not every exception pickles.
+    """
+    stock_df = None
+    error = None
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        try:
+            loader = ExcelDataLoader(data_directory=data_directory, use_pyarrow=use_pyarrow, use_cache=use_cache)
+            stock_df = loader.load_stock_data(filename, sheet_name=sheet_name)
+        except Exception as e:
+            error = str(e)
+    
+    return stock_df, error, [(w.category, str(w.message)) for w in caught]
+
+
 # Convenience functions for quick loading
 def load_excel(filename: str, sheet_name: Optional[Union[str, int]] = None, data_dir: str = "data") -> pd.DataFrame:
     """
@@ -365,7 +651,13 @@ def load_excel(filename: str, sheet_name: Optional[Union[str, int]] = None, data
     return loader.load_excel_file(filename, sheet_name=sheet_name)
 
 
-def load_stock(filename: str, sheet_name: Optional[Union[str, int]] = None, data_dir: Optional[str] = None) -> pd.DataFrame:
+def load_stock(
+    filename: str,
+    sheet_name: Optional[Union[str, int]] = None,
+    data_dir: Optional[str] = None,
+    use_pyarrow: bool = False,
+    use_cache: bool = True
+) -> pd.DataFrame:
     """
     Quick function to load stock data (OHLCV) from an Excel or CSV file.
     
@@ -373,6 +665,9 @@ def load_stock(filename: str, sheet_name: Optional[Union[str, int]] = None, data
         filename: Name of the Excel or CSV file (can be full path or relative)
         sheet_name: Name or index of sheet to load (default: first sheet, only for Excel)
         data_dir: Directory containing data files (default: "data", ignored if filename is full path)
+        use_pyarrow: If True, read CSV files with the pyarrow engine when installed
+        use_cache: If True, cache normalized data as Parquet in a .cache directory
+                   next to the data file
     
     Returns:
         DataFrame with columns: date, open, high, low, close, volume
@@ -380,11 +675,12 @@ def load_stock(filename: str, sheet_name: Optional[Union[str, int]] = None, data
     # If filename is a full path, use it directly
     file_path = Path(filename)
     if file_path.is_absolute() or file_path.exists():
-        loader = ExcelDataLoader(data_directory=".")  # Use current directory
+        # Root the loader at the file's own directory so the cache lands beside it
+        loader = ExcelDataLoader(data_directory=str(file_path.resolve().parent), use_pyarrow=use_pyarrow, use_cache=use_cache)
         return loader.load_stock_data(filename, sheet_name=sheet_name)
     else:
         # Use data directory
-        loader = ExcelDataLoader(data_directory=data_dir or "data")
+        loader = ExcelDataLoader(data_directory=data_dir or "data", use_pyarrow=use_pyarrow, use_cache=use_cache)
         return loader.load_stock_data(filename, sheet_name=sheet_name)
 
 
@@ -1,6 +1,133 @@
 import React, { useState, useEffect, useRef } from 'react'
+import { tableFromIPC } from 'apache-arrow'
 import './App.css'
 
+// Copy one numeric field of a list of records into a typed array
+// (missing or null values become NaN)
+function column(records, key, ArrayType = Float32Array) {
+    const values = new ArrayType(records.length)
+    for (let i = 0; i < records.length; i++) {
+        const record = records[i]
+        const value = record ? record[key] : null
+        values[i] = value === null || value === undefined ? NaN : value
+    }
+    return values
+}
+
+// Convert the JSON records into column arrays, so drawing reads
+// contiguous typed arrays instead of one object per candle
+function toColumns(json) {
+    const { chartData, indicators } = json
+    const columns = {
+        length: chartData.length,
+        dates: chartData.map(d => d.date),
+        opens: column(chartData, 'open'),
+        highs: column(chartData, 'high'),
+        lows: column(chartData, 'low'),
+        closes: column(chartData, 'close'),
+        volumes: column(chartData, 'volume', Float64Array),
+        bbUpper: null,
+        bbMiddle: null,
+        bbLower: null,
+        vwap: null,
+        ma10: null
+    }
+    if (indicators && indicators.bollingerBands) {
+        columns.bbUpper = column(indicators.bollingerBands, 'upper')
+        columns.bbMiddle = column(indicators.bollingerBands, 'middle')
+        columns.bbLower = column(indicators.bollingerBands, 'lower')
+    }
+    if (indicators && indicators.vwap) {
+        columns.vwap = column(indicators.vwap, 'vwap')
+    }
+    if (indicators && indicators.ma10) {
+        columns.ma10 = column(indicators.ma10, 'ma')
+    }
+    return columns
+}
+
+// Canvas that is never attached to the page, used to keep a rendered layer
+function createLayer(width, height) {
+    if (typeof OffscreenCanvas !== 'undefined') {
+        return new OffscreenCanvas(width, height)
+    }
+    const layer = document.createElement('canvas')
+    layer.width = width
+    layer.height = height
+    return layer
+}
+
+// Build the chart data from an Arrow table written by generate_data.py;
+// numeric columns come out as typed arrays without per-candle parsing
+function fromArrow(table) {
+    if (table.numRows === 0) {
+        throw new Error('No chart data found in Arrow file')
+    }
+    const metadata = table.schema.metadata
+    const floats = (name) => {
+        const child = table.getChild(name)
+        return child ? child.toArray() : null
+    }
+    return {
+        minPrice: Number(metadata.get('minPrice')),
+        maxPrice: Number(metadata.get('maxPrice')),
+        priceRange: Number(metadata.get('priceRange')),
+        maxVolume: Number(metadata.get('maxVolume')),
+        columns: {
+            length: table.numRows,
+            dates: Array.from(table.getChild('date')),
+            opens: floats('open'),
+            highs: floats('high'),
+            lows: floats('low'),
+            closes: floats('close'),
+            volumes: floats('volume'),
+            bbUpper: floats('bb_upper'),
+            bbMiddle: floats('bb_middle'),
+            bbLower: floats('bb_lower'),
+            vwap: floats('vwap'),
+            ma10: floats('ma10')
+        }
+    }
+}
+
+function loadArrow() {
+    console.log('Fetching data from /data.arrow...')
+    return fetch('/data.arrow')
+        .then(res => {
+            if (!res.ok) {
+                throw new Error(`HTTP error! status: ${res.status}`)
+            }
+            return res.arrayBuffer()
+        })
+        .then(buffer => fromArrow(tableFromIPC(buffer)))
+}
+
+function loadJson() {
+    console.log('Fetching data from /data.json...')
+    return fetch('/data.json')
+        .then(res => {
+            console.log('Response status:', res.status, res.statusText)
+            if (!res.ok) {
+                throw new Error(`HTTP error! status: ${res.status}`)
+            }
+            return res.json()
+        })
+        .then(data => {
+            console.log('Data loaded successfully:', {
+                hasChartData: !!data.chartData,
+                chartDataLength: data.chartData ? data.chartData.length : 0,
+                minPrice: data.minPrice,
+                maxPrice: data.maxPrice
+            })
+            
+            if (!data.chartData || data.chartData.length === 0) {
+                throw new Error('No chart data found in JSON file')
+            }
+            
+            return { ...data, columns: toColumns(data) }
+        })
+}
+
 function App() {
     const [data, setData] = useState(null)
     const [loading, setLoading] = useState(true)
@@ -9,30 +136,22 @@ function App() {
     const [tooltipPosition, setTooltipPosition] = useState({ x: 0, y: 0 })
     const canvasRef = useRef(null)
     const containerRef = useRef(null)
+    // Last rendered chart (axes, indicators, candles) and its plot area;
+    // hover only copies it back and adds the crosshair
+    const chartLayerRef = useRef(null)
+    const plotAreaRef = useRef(null)
+    // Indicator Path2Ds for the current data and canvas size
+    const indicatorPathsRef = useRef(null)
 
     useEffect(() => {
-        // Load data from JSON file
-        console.log('Fetching data from /data.json...')
-        fetch('/data.json')
-            .then(res => {
-                console.log('Response status:', res.status, res.statusText)
-                if (!res.ok) {
-                    throw new Error(`HTTP error! status: ${res.status}`)
-                }
-                return res.json()
+        // Load the Arrow file, falling back to the JSON file when it is
+        // missing (generate_data.py only writes it when pyarrow is installed)
+        loadArrow()
+            .catch(err => {
+                console.log('Arrow data not available, using JSON:', err.message)
+                return loadJson()
             })
             .then(data => {
-                console.log('Data loaded successfully:', {
-                    hasChartData: !!data.chartData,
-                    chartDataLength: data.chartData ? data.chartData.length : 0,
-                    minPrice: data.minPrice,
-                    maxPrice: data.maxPrice
-                })
-                
-                if (!data.chartData || data.chartData.length === 0) {
-                    throw new Error('No chart data found in JSON file')
-                }
-                
                 setData(data)
                 setLoading(false)
             })
@@ -55,6 +174,10 @@ function App() {
         }
     }, [data])
 
+    useEffect(() => {
+        presentChart(hoveredCandleIndex)
+    }, [hoveredCandleIndex])
+
     const drawChart = () => {
         const canvas = canvasRef.current
         if (!canvas || !data || !containerRef.current) {
@@ -62,7 +185,6 @@ function App() {
             return
         }
 
-        const ctx = canvas.getContext('2d')
         const container = containerRef.current
         
         // Set canvas size - use actual container dimensions
@@ -71,6 +193,8 @@ function App() {
         
         canvas.width = containerWidth
         canvas.height = containerHeight
+        const layer = createLayer(canvas.width, canvas.height)
+        const ctx = layer.getContext('2d')
         
         console.log('Drawing chart with dimensions:', canvas.width, 'x', canvas.height)
 
@@ -81,20 +205,24 @@ function App() {
         const chartX = padding.left
         const chartY = padding.top
 
-        const { chartData, minPrice, maxPrice, priceRange, maxVolume } = data
-        const dataLength = chartData.length
+        const { columns, minPrice, maxPrice, priceRange, maxVolume } = data
+        const dataLength = columns.length
 
         // Clear canvas
         ctx.clearRect(0, 0, canvas.width, canvas.height)
 
-        // Helper functions
+        // Helper functions. Candle x positions and the price scale are
+        // computed once per draw, so the loops only index and multiply.
+        const yBase = chartY + chartHeight
+        const yScale = chartHeight / priceRange
         const priceToY = (price) => {
-            return chartY + chartHeight - ((price - minPrice) / priceRange) * chartHeight
+            return yBase - (price - minPrice) * yScale
         }
 
-        const indexToX = (index) => {
-            if (dataLength <= 1) return chartX
-            return chartX + (index / (dataLength - 1)) * chartWidth
+        const xStep = dataLength <= 1 ? 0 : chartWidth / (dataLength - 1)
+        const xs = new Float64Array(dataLength)
+        for (let i = 0; i < dataLength; i++) {
+            xs[i] = chartX + i * xStep
         }
 
         const volumeToDepth = (volume) => {
@@ -119,7 +247,7 @@ function App() {
         // Vertical grid lines
         const dateStep = Math.max(1, Math.floor(dataLength / 12))
         for (let i = 0; i < dataLength; i += dateStep) {
-            const x = indexToX(i)
+            const x = xs[i]
             ctx.beginPath()
             ctx.moveTo(x, chartY)
             ctx.lineTo(x, chartY + chartHeight)
@@ -158,168 +286,141 @@ function App() {
         ctx.textBaseline = 'top'
 
         for (let i = 0; i < dataLength; i += dateStep) {
-            const x = indexToX(i)
-            const date = new Date(chartData[i].date + 'T00:00:00')
+            const x = xs[i]
+            const date = new Date(columns.dates[i] + 'T00:00:00')
             const dateStr = date.toLocaleDateString('en-US', { month: 'short', day: 'numeric' })
             ctx.fillText(dateStr, x, chartY + chartHeight + 15)
         }
 
-        // Draw indicators first (behind candles)
-        const { indicators } = data
-        
-        // Draw Bollinger Bands
-        if (indicators && indicators.bollingerBands) {
-            const bb = indicators.bollingerBands
-            
-            // Draw upper band
-            ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)'
-            ctx.lineWidth = 1.5
-            ctx.setLineDash([5, 5])
-            ctx.beginPath()
+        // Indicator lines only depend on the data and the canvas size, so
+        // their paths are built once and reused by later draws
+        const seriesPath = (values) => {
+            const path = new Path2D()
             let firstPoint = true
-            for (let i = 0; i < bb.length; i++) {
-                if (bb[i] && bb[i].upper !== null) {
-                    const x = indexToX(i)
-                    const y = priceToY(bb[i].upper)
-                    if (firstPoint) {
-                        ctx.moveTo(x, y)
-                        firstPoint = false
+            for (let i = 0; i < values.length; i++) {
+                const value = values[i]
+                if (isNaN(value)) continue
+                const x = xs[i]
+                const y = priceToY(value)
+                if (firstPoint) {
+                    path.moveTo(x, y)
+                    firstPoint = false
+                } else {
+                    path.lineTo(x, y)
+                }
+            }
+            return path
+        }
+
+        const buildIndicatorPaths = () => {
+            const paths = { bbUpper: null, bbMiddle: null, bbLower: null, bbFill: null, vwap: null, ma10: null }
+            if (columns.bbUpper) {
+                const { bbUpper, bbMiddle, bbLower } = columns
+                paths.bbUpper = seriesPath(bbUpper)
+                paths.bbMiddle = seriesPath(bbMiddle)
+                paths.bbLower = seriesPath(bbLower)
+
+                // Area between bands: along the upper band, back along the lower,
+                // over the indices where both bands are defined
+                const bandIndices = []
+                for (let i = 0; i < bbUpper.length; i++) {
+                    if (!isNaN(bbUpper[i]) && !isNaN(bbLower[i])) bandIndices.push(i)
+                }
+                const fill = new Path2D()
+                for (let k = 0; k < bandIndices.length; k++) {
+                    const i = bandIndices[k]
+                    if (k === 0) {
+                        fill.moveTo(xs[i], priceToY(bbUpper[i]))
                     } else {
-                        ctx.lineTo(x, y)
+                        fill.lineTo(xs[i], priceToY(bbUpper[i]))
                     }
                 }
+                for (let k = bandIndices.length - 1; k >= 0; k--) {
+                    const i = bandIndices[k]
+                    fill.lineTo(xs[i], priceToY(bbLower[i]))
+                }
+                fill.closePath()
+                paths.bbFill = fill
             }
-            ctx.stroke()
+            if (columns.vwap) paths.vwap = seriesPath(columns.vwap)
+            if (columns.ma10) paths.ma10 = seriesPath(columns.ma10)
+            return paths
+        }
+
+        let cachedPaths = indicatorPathsRef.current
+        if (!cachedPaths || cachedPaths.columns !== columns ||
+            cachedPaths.width !== canvas.width || cachedPaths.height !== canvas.height) {
+            cachedPaths = {
+                columns: columns,
+                width: canvas.width,
+                height: canvas.height,
+                paths: buildIndicatorPaths()
+            }
+            indicatorPathsRef.current = cachedPaths
+        }
+        const paths = cachedPaths.paths
+
+        // Draw indicators first (behind candles), starting with Bollinger Bands
+        if (paths.bbUpper) {
+            // Draw upper band
+            ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)'
+            ctx.lineWidth = 1.5
+            ctx.setLineDash([5, 5])
+            ctx.stroke(paths.bbUpper)
             
             // Draw middle band
             ctx.strokeStyle = 'rgba(255, 152, 0, 0.8)'
             ctx.lineWidth = 1.5
-            ctx.beginPath()
-            firstPoint = true
-            for (let i = 0; i < bb.length; i++) {
-                if (bb[i] && bb[i].middle !== null) {
-                    const x = indexToX(i)
-                    const y = priceToY(bb[i].middle)
-                    if (firstPoint) {
-                        ctx.moveTo(x, y)
-                        firstPoint = false
-                    } else {
-                        ctx.lineTo(x, y)
-                    }
-                }
-            }
-            ctx.stroke()
+            ctx.stroke(paths.bbMiddle)
             
             // Draw lower band
             ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)'
             ctx.lineWidth = 1.5
-            ctx.beginPath()
-            firstPoint = true
-            for (let i = 0; i < bb.length; i++) {
-                if (bb[i] && bb[i].lower !== null) {
-                    const x = indexToX(i)
-                    const y = priceToY(bb[i].lower)
-                    if (firstPoint) {
-                        ctx.moveTo(x, y)
-                        firstPoint = false
-                    } else {
-                        ctx.lineTo(x, y)
-                    }
-                }
-            }
-            ctx.stroke()
+            ctx.stroke(paths.bbLower)
             ctx.setLineDash([])
             
             // Fill between bands
             ctx.fillStyle = 'rgba(255, 152, 0, 0.1)'
-            ctx.beginPath()
-            firstPoint = true
-            for (let i = 0; i < bb.length; i++) {
-                if (bb[i] && bb[i].upper !== null && bb[i].lower !== null) {
-                    const x = indexToX(i)
-                    const upperY = priceToY(bb[i].upper)
-                    if (firstPoint) {
-                        ctx.moveTo(x, upperY)
-                        firstPoint = false
-                    } else {
-                        ctx.lineTo(x, upperY)
-                    }
-                }
-            }
-            for (let i = bb.length - 1; i >= 0; i--) {
-                if (bb[i] && bb[i].upper !== null && bb[i].lower !== null) {
-                    const x = indexToX(i)
-                    const lowerY = priceToY(bb[i].lower)
-                    ctx.lineTo(x, lowerY)
-                }
-            }
-            ctx.closePath()
-            ctx.fill()
+            ctx.fill(paths.bbFill)
         }
         
         // Draw VWAP
-        if (indicators && indicators.vwap) {
+        if (paths.vwap) {
             ctx.strokeStyle = '#FFC107'
             ctx.lineWidth = 2
             ctx.setLineDash([3, 3])
-            ctx.beginPath()
-            
-            let firstPoint = true
-            for (let i = 0; i < indicators.vwap.length; i++) {
-                const vwap = indicators.vwap[i]
-                if (vwap && vwap.vwap !== null && vwap.vwap !== undefined) {
-                    const x = indexToX(i)
-                    const y = priceToY(vwap.vwap)
-                    
-                    if (firstPoint) {
-                        ctx.moveTo(x, y)
-                        firstPoint = false
-                    } else {
-                        ctx.lineTo(x, y)
-                    }
-                }
-            }
-            ctx.stroke()
+            ctx.stroke(paths.vwap)
             ctx.setLineDash([])
         }
         
         // Draw MA10
-        if (indicators && indicators.ma10) {
+        if (paths.ma10) {
             ctx.strokeStyle = '#f44336'
             ctx.lineWidth = 2
-            ctx.beginPath()
-            
-            let firstPoint = true
-            for (let i = 0; i < indicators.ma10.length; i++) {
-                const ma = indicators.ma10[i]
-                if (ma && ma.ma !== null && ma.ma !== undefined) {
-                    const x = indexToX(i)
-                    const y = priceToY(ma.ma)
-                    
-                    if (firstPoint) {
-                        ctx.moveTo(x, y)
-                        firstPoint = false
-                    } else {
-                        ctx.lineTo(x, y)
-                    }
-                }
-            }
-            ctx.stroke()
+            ctx.stroke(paths.ma10)
         }
 
-        // Draw candles
+        // Draw candles. Geometry is collected into one Path2D per color and
+        // part, then drawn with a fixed handful of fill/stroke calls.
+        const { opens, highs, lows, closes, volumes } = columns
+        const bullWicks = new Path2D()
+        const bearWicks = new Path2D()
+        const bullBodies = new Path2D()
+        const bearBodies = new Path2D()
+        const bullFaces = new Path2D()
+        const bearFaces = new Path2D()
+        const shadows = new Path2D()
         window.candles = []
         for (let i = 0; i < dataLength; i++) {
-            const candle = chartData[i]
-            const x = indexToX(i)
-            const depth = volumeToDepth(candle.volume)
+            const x = xs[i]
+            const depth = volumeToDepth(volumes[i])
 
-            const openY = priceToY(candle.open)
-            const closeY = priceToY(candle.close)
-            const highY = priceToY(candle.high)
-            const lowY = priceToY(candle.low)
+            const openY = priceToY(opens[i])
+            const closeY = priceToY(closes[i])
+            const highY = priceToY(highs[i])
+            const lowY = priceToY(lows[i])
 
-            const isBullish = candle.close > candle.open
+            const isBullish = closes[i] > opens[i]
             const bodyTop = Math.min(openY, closeY)
             const bodyBottom = Math.max(openY, closeY)
             const bodyHeight = Math.max(1, bodyBottom - bodyTop)
@@ -327,62 +428,39 @@ function App() {
             
             // Ensure candle is visible
             if (isNaN(x) || isNaN(openY) || isNaN(closeY) || isNaN(highY) || isNaN(lowY)) {
-                console.warn('Invalid candle data at index', i, candle)
+                console.warn('Invalid candle data at index', i, columns.dates[i])
                 continue
             }
 
-            // Draw wick
-            ctx.strokeStyle = isBullish ? '#10b981' : '#ef4444'
-            ctx.lineWidth = 2
-            ctx.beginPath()
-            ctx.moveTo(x + candleWidth / 2, highY)
-            ctx.lineTo(x + candleWidth / 2, lowY)
-            ctx.stroke()
+            // Wick
+            const wicks = isBullish ? bullWicks : bearWicks
+            wicks.moveTo(x + candleWidth / 2, highY)
+            wicks.lineTo(x + candleWidth / 2, lowY)
 
-            // Draw body
-            if (isBullish) {
-                ctx.fillStyle = '#10b981'  // Green
-                ctx.strokeStyle = '#059669'  // Darker green border
-            } else {
-                ctx.fillStyle = '#ef4444'  // Red
-                ctx.strokeStyle = '#dc2626'  // Darker red border
-            }
-            ctx.lineWidth = 2
-            ctx.beginPath()
-            ctx.rect(x, bodyTop, candleWidth, bodyHeight)
-            ctx.fill()
-            ctx.stroke()
+            // Body
+            const bodies = isBullish ? bullBodies : bearBodies
+            bodies.rect(x, bodyTop, candleWidth, bodyHeight)
 
             // 3D effect
             if (depth > 0) {
-                const alpha = 0.5
-                ctx.fillStyle = isBullish 
-                    ? `rgba(16, 185, 129, ${alpha})`  // Green
-                    : `rgba(239, 68, 68, ${alpha})`  // Red
+                const faces = isBullish ? bullFaces : bearFaces
 
                 // Right face
-                ctx.beginPath()
-                ctx.moveTo(x + candleWidth, bodyTop)
-                ctx.lineTo(x + candleWidth + depth, bodyTop - depth)
-                ctx.lineTo(x + candleWidth + depth, bodyBottom - depth)
-                ctx.lineTo(x + candleWidth, bodyBottom)
-                ctx.closePath()
-                ctx.fill()
+                faces.moveTo(x + candleWidth, bodyTop)
+                faces.lineTo(x + candleWidth + depth, bodyTop - depth)
+                faces.lineTo(x + candleWidth + depth, bodyBottom - depth)
+                faces.lineTo(x + candleWidth, bodyBottom)
+                faces.closePath()
 
                 // Top face
-                ctx.beginPath()
-                ctx.moveTo(x, bodyTop)
-                ctx.lineTo(x + depth, bodyTop - depth)
-                ctx.lineTo(x + candleWidth + depth, bodyTop - depth)
-                ctx.lineTo(x + candleWidth, bodyTop)
-                ctx.closePath()
-                ctx.fill()
+                faces.moveTo(x, bodyTop)
+                faces.lineTo(x + depth, bodyTop - depth)
+                faces.lineTo(x + candleWidth + depth, bodyTop - depth)
+                faces.lineTo(x + candleWidth, bodyTop)
+                faces.closePath()
 
                 // Shadow
-                ctx.fillStyle = 'rgba(0, 0, 0, 0.1)'
-                ctx.beginPath()
-                ctx.rect(x + depth, chartY + chartHeight - depth, candleWidth, depth)
-                ctx.fill()
+                shadows.rect(x + depth, chartY + chartHeight - depth, candleWidth, depth)
             }
 
             window.candles.push({
@@ -390,14 +468,58 @@ function App() {
                 y: Math.min(highY, bodyTop),
                 width: candleWidth + depth,
                 height: Math.abs(lowY - highY),
-                index: i,
-                candle: candle
+                index: i
             })
         }
+
+        ctx.lineWidth = 2
+
+        // Wicks
+        ctx.strokeStyle = '#10b981'
+        ctx.stroke(bullWicks)
+        ctx.strokeStyle = '#ef4444'
+        ctx.stroke(bearWicks)
+
+        // Bodies
+        ctx.fillStyle = '#10b981'  // Green
+        ctx.strokeStyle = '#059669'  // Darker green border
+        ctx.fill(bullBodies)
+        ctx.stroke(bullBodies)
+        ctx.fillStyle = '#ef4444'  // Red
+        ctx.strokeStyle = '#dc2626'  // Darker red border
+        ctx.fill(bearBodies)
+        ctx.stroke(bearBodies)
+
+        // 3D side faces and shadows
+        ctx.fillStyle = 'rgba(16, 185, 129, 0.5)'
+        ctx.fill(bullFaces)
+        ctx.fillStyle = 'rgba(239, 68, 68, 0.5)'
+        ctx.fill(bearFaces)
+        ctx.fillStyle = 'rgba(0, 0, 0, 0.1)'
+        ctx.fill(shadows)
+        
+        chartLayerRef.current = layer
+        plotAreaRef.current = { y: chartY, height: chartHeight }
+        presentChart(hoveredCandleIndex)
         
-        // Draw vertical line if hovering (after candles are drawn)
-        if (hoveredCandleIndex !== null && window.candles && window.candles[hoveredCandleIndex]) {
-            const candle = window.candles[hoveredCandleIndex]
+        console.log('Chart drawn successfully with', window.candles.length, 'candles')
+    }
+
+    // Copy the rendered chart to the page canvas and draw the crosshair
+    // through the hovered candle, without redrawing the chart itself
+    const presentChart = (hoverIndex) => {
+        const canvas = canvasRef.current
+        const layer = chartLayerRef.current
+        if (!canvas || !layer) return
+
+        const ctx = canvas.getContext('2d')
+        ctx.clearRect(0, 0, canvas.width, canvas.height)
+        ctx.drawImage(layer, 0, 0)
+
+        // Draw vertical line if hovering
+        if (hoverIndex !== null && window.candles && window.candles[hoverIndex]) {
+            const { y: chartY, height: chartHeight } = plotAreaRef.current
+            const candle = window.candles[hoverIndex]
             const x = candle.x + candle.width / 2
             ctx.strokeStyle = '#FFD700'
             ctx.lineWidth = 2
@@ -408,8 +530,6 @@ function App() {
             ctx.stroke()
             ctx.setLineDash([])
         }
-        
-        console.log('Chart drawn successfully with', window.candles.length, 'candles')
     }
 
     const handleMouseMove = (e) => {
@@ -519,7 +639,8 @@ function App() {
         )
     }
 
-    const { chartData, minPrice, maxPrice, maxVolume } = data
+    const { columns, minPrice, maxPrice, maxVolume } = data
+    const hoveredIndex = hoveredCandle ? hoveredCandle.index : null
 
     return (
         <div className="app">
@@ -555,7 +676,7 @@ function App() {
                             <div className="tooltip-row">
                                 <span className="tooltip-label">Date:</span>
                                 <span className="tooltip-value">
-                                    {new Date(hoveredCandle.candle.date + 'T00:00:00').toLocaleDateString('en-US', {
+                                    {new Date(columns.dates[hoveredIndex] + 'T00:00:00').toLocaleDateString('en-US', {
                                         year: 'numeric',
                                         month: 'long',
                                         day: 'numeric'
@@ -564,23 +685,23 @@ function App() {
                             </div>
                             <div className="tooltip-row">
                                 <span className="tooltip-label">Open:</span>
-                                <span className="tooltip-value">₹{hoveredCandle.candle.open.toFixed(2)}</span>
+                                <span className="tooltip-value">₹{columns.opens[hoveredIndex].toFixed(2)}</span>
                             </div>
                             <div className="tooltip-row">
                                 <span className="tooltip-label">High:</span>
-                                <span className="tooltip-value">₹{hoveredCandle.candle.high.toFixed(2)}</span>
+                                <span className="tooltip-value">₹{columns.highs[hoveredIndex].toFixed(2)}</span>
                             </div>
                             <div className="tooltip-row">
                                 <span className="tooltip-label">Low:</span>
-                                <span className="tooltip-value">₹{hoveredCandle.candle.low.toFixed(2)}</span>
+                                <span className="tooltip-value">₹{columns.lows[hoveredIndex].toFixed(2)}</span>
                             </div>
                             <div className="tooltip-row">
                                 <span className="tooltip-label">Close:</span>
-                                <span className="tooltip-value">₹{hoveredCandle.candle.close.toFixed(2)}</span>
+                                <span className="tooltip-value">₹{columns.closes[hoveredIndex].toFixed(2)}</span>
                             </div>
                             <div className="tooltip-row">
                                 <span className="tooltip-label">Volume:</span>
-                                <span className="tooltip-value">{hoveredCandle.candle.volume.toLocaleString()}</span>
+                                <span className="tooltip-value">{columns.volumes[hoveredIndex].toLocaleString()}</span>
                             </div>
                         </div>
                     )}
@@ -615,7 +736,7 @@ function App() {
                 <div className="info-panel">
                     <div className="info-item">
                         <span className="info-label">Total Data Points:</span>
-                        <span className="info-value">{chartData.length} days</span>
+                        <span className="info-value">{columns.length} days</span>
                     </div>
                     <div className="info-item">
                         <span className="info-label">Price Range:</span>
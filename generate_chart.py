@@ -3,70 +3,171 @@ Generate HTML candlestick chart from stock data
 """
 
 from data_loader import load_stock
-from calculation import calculate_ma_dict, calculate_bollinger_bands_dict, calculate_vwap_dict
 from price_predictor import get_market_direction_predictions
+import argparse
+from collections import Counter
+import hashlib
 import json
-import pandas as pd
+import shutil
+from pathlib import Path
+from typing import Optional, Union
+import numpy as np
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 # Local file path
 DATA_FILE = r"C:\Users\veenu\Downloads\ongc24-25.csv"
 
-# Load data
-print("Loading data...")
-df = load_stock(DATA_FILE)
-print(f"Loaded {len(df)} rows")
-
-# Prepare data for chart
-chart_data = []
-for _, row in df.iterrows():
-    volume = row['volume']
-    if pd.isna(volume):
-        volume = 0
+# Bump when the embedded chart data or the prediction logic changes so stale
+# cached blocks are not reused
+CHART_CACHE_VERSION = 1
+
+
+def write_json(f, obj) -> None:
+    """
+    Write obj as JSON to a binary file, using orjson when installed.
+    
+    NumPy arrays are serialized directly by orjson and via tolist() otherwise.
+    The fallback encoder writes chunk by chunk rather than building the whole
+    JSON string first.
+    
+    Args:
+        f: File opened in binary mode
+        obj: JSON-compatible object, may contain NumPy arrays
+    """
+    if _HAS_ORJSON:
+        f.write(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY))
+        return
+    encoder = json.JSONEncoder(default=lambda value: value.tolist())
+    for chunk in encoder.iterencode(obj):
+        f.write(chunk.encode('utf-8'))
+
+
+def chart_cache_dir(data_file: Union[str, Path], cache_root: Union[str, Path] = ".cache") -> Optional[Path]:
+    """
+    Locate the cache directory for a data file, keyed by a hash of its contents.
+    
+    Args:
+        data_file: CSV or Excel file with OHLCV data
+        cache_root: Directory holding cached chart data (default: ".cache")
     
-    chart_data.append({
-        'date': row['date'].strftime('%Y-%m-%d'),
-        'open': float(row['open']),
-        'high': float(row['high']),
-        'low': float(row['low']),
-        'close': float(row['close']),
-        'volume': float(volume)
-    })
-
-# Calculate chart dimensions
-min_price = float(df['low'].min())
-max_price = float(df['high'].max())
-price_range = max_price - min_price
-max_volume = float(df['volume'].max())
-if pd.isna(max_volume) or max_volume == 0:
-    max_volume = 1.0
-
-print(f"Price range: Rs {min_price:.2f} - Rs {max_price:.2f}")
-print(f"Max volume: {max_volume:,.0f}")
-
-# Calculate technical indicators
-print("Calculating technical indicators...")
-ma_10 = calculate_ma_dict(df, period=10)
-bollinger_bands = calculate_bollinger_bands_dict(df, period=20, num_std=2.0)
-vwap = calculate_vwap_dict(df)
-print("[OK] Calculated 10-day MA")
-print("[OK] Calculated Bollinger Bands")
-print("[OK] Calculated VWAP")
-print(f"  VWAP sample (first 3): {vwap[:3]}")
-print(f"  VWAP sample (last 3): {vwap[-3:]}")
-
-# Calculate price predictions using market direction logic
-print("Generating predictions...")
-print("Note: Market direction logic to be implemented by user")
-
-predictions = get_market_direction_predictions(df)
-print(f"[OK] Generated {len(predictions)} predictions")
-if predictions:
-    rise_count = sum(1 for p in predictions if p and p.get('prediction') == 'rise')
-    fall_count = sum(1 for p in predictions if p and p.get('prediction') == 'fall')
-    print(f"  Predictions: {rise_count} rise, {fall_count} fall")
-
-# Generate HTML with embedded JavaScript
-html_content = f"""<!DOCTYPE html>
+    Returns:
+        Path of the cache directory, or None if data_file is not a readable file
+    """
+    digest = hashlib.blake2b(f"v{CHART_CACHE_VERSION}".encode(), digest_size=16)
+    try:
+        with open(data_file, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    except OSError:
+        return None
+    return Path(cache_root) / f"chart_{digest.hexdigest()}"
+
+
+def prepare_chart_data(data_file: str) -> tuple:
+    """
+    Load stock data and compute everything the chart page embeds.
+    
+    Args:
+        data_file: CSV or Excel file with OHLCV data
+    
+    Returns:
+        Tuple of (chart_data, predictions, meta) where chart_data holds the
+        candle column arrays and meta the price range, max volume and candle count
+    """
+    # Load data
+    print("Loading data...")
+    df = load_stock(data_file, use_pyarrow=True)
+    print(f"Loaded {len(df)} rows")
+
+    # Missing volume is treated as zero everywhere below
+    df['volume'] = df['volume'].fillna(0)
+
+    # Prepare data for chart as parallel column arrays (one entry per candle).
+    # Prices are rounded to 2 decimals and volumes to whole shares so the embedded
+    # JSON uses short literals; the page holds prices as float32. The technical
+    # indicators (MA 10, Bollinger Bands, VWAP) are computed by the page from
+    # these arrays. Dates are shipped as days since 1970-01-01; the page only
+    # formats the few it displays.
+    ohlc = df[['open', 'high', 'low', 'close']].to_numpy(dtype=np.float64).round(2)
+    volumes = df['volume'].to_numpy(dtype=np.float64).round()
+    chart_data = {
+        'day': df['date'].to_numpy(dtype='datetime64[D]').astype(np.int32),
+        'open': ohlc[:, 0],
+        'high': ohlc[:, 1],
+        'low': ohlc[:, 2],
+        'close': ohlc[:, 3],
+        'volume': volumes.astype(np.int64)
+    }
+
+    # Calculate chart dimensions
+    min_price = float(df['low'].min())
+    max_price = float(df['high'].max())
+    max_volume = float(df['volume'].max()) if len(df) else 0.0
+    if max_volume == 0:
+        max_volume = 1.0
+
+    print(f"Price range: Rs {min_price:.2f} - Rs {max_price:.2f}")
+    print(f"Max volume: {max_volume:,.0f}")
+
+    # Calculate price predictions using market direction logic
+    print("Generating predictions...")
+    print("Note: Market direction logic to be implemented by user")
+
+    predictions = get_market_direction_predictions(df)
+    print(f"[OK] Generated {len(predictions)} predictions")
+    if predictions:
+        counts = Counter(p.get('prediction') for p in predictions if p)
+        print(f"  Predictions: {counts['rise']} rise, {counts['fall']} fall")
+
+    meta = {
+        'min_price': min_price,
+        'max_price': max_price,
+        'max_volume': max_volume,
+        'num_candles': len(df)
+    }
+    return chart_data, predictions, meta
+
+
+def main(data_file: str = DATA_FILE, output_file: str = "candlestick_chart.html", use_cache: bool = True):
+    """
+    Load stock data and predictions and write the standalone HTML chart.
+    
+    The serialized candles and predictions are cached under .cache/, keyed by
+    the data file's contents, so regenerating the page for an unchanged file
+    skips loading and prediction entirely.
+    """
+    cache_dir = chart_cache_dir(data_file) if use_cache else None
+    if cache_dir is not None and (cache_dir / 'meta.json').exists():
+        print(f"[OK] Reusing cached chart data from {cache_dir}")
+        with open(cache_dir / 'meta.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        chart_data = predictions = None
+    else:
+        chart_data, predictions, meta = prepare_chart_data(data_file)
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_dir / 'candles.json', 'wb') as f:
+                write_json(f, chart_data)
+            with open(cache_dir / 'predictions.json', 'wb') as f:
+                write_json(f, predictions)
+            # Written last: its presence marks a complete cache entry
+            with open(cache_dir / 'meta.json', 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+
+    min_price = meta['min_price']
+    max_price = meta['max_price']
+    price_range = max_price - min_price
+    max_volume = meta['max_volume']
+    num_candles = meta['num_candles']
+
+    # Generate HTML with embedded JavaScript. The page is written in pieces
+    # around the embedded JSON so the data is never copied into one big string.
+    html_head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -126,6 +227,16 @@ html_content = f"""<!DOCTYPE html>
             display: block;
         }}
 
+        /* Hover line layer stacked on the chart; mouse events pass through */
+        #overlayCanvas {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            pointer-events: none;
+        }}
+
         .tooltip {{
             position: absolute;
             background: rgba(0, 0, 0, 0.9);
@@ -276,6 +387,7 @@ html_content = f"""<!DOCTYPE html>
         
         <div class="chart-container">
             <canvas id="chartCanvas"></canvas>
+            <canvas id="overlayCanvas"></canvas>
             <div id="tooltip" class="tooltip"></div>
         </div>
 
@@ -317,7 +429,7 @@ html_content = f"""<!DOCTYPE html>
         </div>
 
         <div class="info-panel">
-            <p><strong>Total Data Points:</strong> {len(chart_data)} days</p>
+            <p><strong>Total Data Points:</strong> {num_candles} days</p>
             <p><strong>Price Range:</strong> ₹{min_price:.2f} - ₹{max_price:.2f}</p>
             <p><strong>Max Volume:</strong> {max_volume:,.0f}</p>
         </div>
@@ -325,885 +437,888 @@ html_content = f"""<!DOCTYPE html>
 
     <script>
         // Chart data
-        const data = {json.dumps(chart_data)};
+        // Column arrays: data.day[i] (days since 1970-01-01), data.open[i],
+        // data.close[i], ... describe candle i
+        const data = """
+    html_middle = f""";
+        // Typed arrays for the draw loops; prices only need float32, volume
+        // stays float64 so large volumes show exactly in the tooltip
+        for (const key of ['open', 'high', 'low', 'close']) {{
+            data[key] = Float32Array.from(data[key]);
+        }}
+        data.volume = Float64Array.from(data.volume);
+        data.day = Int32Array.from(data.day);
         const minPrice = {min_price};
         const maxPrice = {max_price};
         const priceRange = {price_range};
         const maxVolume = {max_volume};
-        const dataLength = {len(chart_data)};
+        const dataLength = {num_candles};
         
-        // Technical indicators
+        // Technical indicators, computed here from the candle arrays. Each
+        // series holds one value per candle, NaN where it is undefined.
+
+        // Simple moving average; NaNs are skipped and each window averages
+        // its valid values (partial windows at the start included)
+        function sma(values, period) {{
+            const out = new Float32Array(values.length);
+            let sum = 0;
+            let count = 0;
+            for (let i = 0; i < values.length; i++) {{
+                const x = values[i];
+                if (!isNaN(x)) {{
+                    sum += x;
+                    count++;
+                }}
+                if (i >= period) {{
+                    const old = values[i - period];
+                    if (!isNaN(old)) {{
+                        sum -= old;
+                        count--;
+                    }}
+                }}
+                out[i] = count > 0 ? sum / count : NaN;
+            }}
+            return out;
+        }}
+
+        // Bollinger Bands from a rolling mean and sample std (Welford
+        // add/remove updates); the bands need two valid values in the window
+        function bollingerBands(values, period, numStd) {{
+            const n = values.length;
+            const upper = new Float32Array(n);
+            const middle = new Float32Array(n);
+            const lower = new Float32Array(n);
+            let count = 0;
+            let mean = 0;
+            let m2 = 0;
+            for (let i = 0; i < n; i++) {{
+                const x = values[i];
+                if (!isNaN(x)) {{
+                    count++;
+                    const delta = x - mean;
+                    mean += delta / count;
+                    m2 += delta * (x - mean);
+                }}
+                if (i >= period) {{
+                    const old = values[i - period];
+                    if (!isNaN(old)) {{
+                        count--;
+                        if (count === 0) {{
+                            mean = 0;
+                            m2 = 0;
+                        }} else {{
+                            const delta = old - mean;
+                            mean -= delta / count;
+                            m2 -= delta * (old - mean);
+                        }}
+                    }}
+                }}
+                if (count === 0) {{
+                    upper[i] = middle[i] = lower[i] = NaN;
+                    continue;
+                }}
+                middle[i] = mean;
+                if (count < 2) {{
+                    upper[i] = lower[i] = NaN;
+                }} else {{
+                    const std = Math.sqrt(Math.max(m2, 0) / (count - 1));
+                    upper[i] = mean + std * numStd;
+                    lower[i] = mean - std * numStd;
+                }}
+            }}
+            return {{ upper: upper, middle: middle, lower: lower }};
+        }}
+
+        // Cumulative VWAP from running sums of typical price * volume and
+        // volume; rows where it is undefined fall back to the typical price
+        function vwapSeries(high, low, close, volume) {{
+            const out = new Float32Array(high.length);
+            let cumulativePV = 0;
+            let cumulativeVolume = 0;
+            for (let i = 0; i < high.length; i++) {{
+                const typicalPrice = (high[i] + low[i] + close[i]) / 3;
+                const vol = isNaN(volume[i]) ? 0 : volume[i];
+                const pv = typicalPrice * vol;
+                if (!isNaN(pv)) {{
+                    cumulativePV += pv;
+                }}
+                cumulativeVolume += vol;
+                let value = NaN;
+                if (!isNaN(pv) && cumulativeVolume !== 0) {{
+                    value = cumulativePV / cumulativeVolume;
+                }}
+                out[i] = Number.isFinite(value) ? value : typicalPrice;
+            }}
+            return out;
+        }}
+
+        const bands = bollingerBands(data.close, 20, 2.0);
         const indicators = {{
-            ma10: {json.dumps(ma_10)},
-            bollingerBands: {json.dumps(bollinger_bands)},
-            vwap: {json.dumps(vwap)}
+            ma10: sma(data.close, 10),
+            bbUpper: bands.upper,
+            bbMiddle: bands.middle,
+            bbLower: bands.lower,
+            vwap: vwapSeries(data.high, data.low, data.close, data.volume)
         }};
         
         // Price predictions
-        const predictions = {json.dumps(predictions)};
+        const predictions = """
+    html_tail = f""";
 
         console.log('Data loaded:', dataLength, 'candles');
         console.log('Price range:', minPrice, 'to', maxPrice);
-        console.log('First candle:', data[0]);
-        console.log('Last candle:', data[dataLength - 1]);
+        console.log('First candle:', candleAt(0));
+        console.log('Last candle:', candleAt(dataLength - 1));
         console.log('VWAP data:', indicators.vwap ? indicators.vwap.length + ' points' : 'missing');
         if (indicators.vwap && indicators.vwap.length > 0) {{
             console.log('First VWAP:', indicators.vwap[0]);
             console.log('Last VWAP:', indicators.vwap[indicators.vwap.length - 1]);
         }}
 
-        // Canvas setup
-        const canvas = document.getElementById('chartCanvas');
-        const ctx = canvas.getContext('2d');
-        const tooltip = document.getElementById('tooltip');
-
-        // Set canvas size
-        function resizeCanvas() {{
-            const container = canvas.parentElement;
-            if (!container) {{
-                console.error('Container not found');
-                return;
-            }}
-            const width = container.clientWidth || container.offsetWidth || 1200;
-            const height = container.clientHeight || container.offsetHeight || 700;
-            canvas.width = width;
-            canvas.height = height;
-            console.log('Canvas resized to:', width, 'x', height);
-            drawChart();
-        }}
-
-        window.addEventListener('resize', resizeCanvas);
-        
-        // Wait for DOM to be ready
-        if (document.readyState === 'loading') {{
-            document.addEventListener('DOMContentLoaded', () => {{
-                setTimeout(resizeCanvas, 100);
-            }});
-        }} else {{
-            setTimeout(resizeCanvas, 100);
-        }}
-
-        // Chart dimensions - Y-axis on the right
-        const padding = {{ top: 50, right: 100, bottom: 80, left: 80 }};
-        let chartWidth, chartHeight, chartX, chartY;
-
-        function updateDimensions() {{
-            chartWidth = canvas.width - padding.left - padding.right;
-            chartHeight = canvas.height - padding.top - padding.bottom;
-            chartX = padding.left;
-            chartY = padding.top;
-        }}
-
-        // Convert price to Y coordinate
-        function priceToY(price) {{
-            return chartY + chartHeight - ((price - minPrice) / priceRange) * chartHeight;
-        }}
-
-        // Convert index to X coordinate (with zoom support)
-        function indexToX(index) {{
-            const visible = getVisibleRange();
-            if (visible.count <= 1) return chartX;
-            const relativeIndex = index - visible.start;
-            return chartX + (relativeIndex / (visible.count - 1)) * chartWidth;
+        // Assemble one candle as an object (for logging and the tooltip)
+        function candleAt(i) {{
+            return {{
+                date: new Date(data.day[i] * 86400000),
+                open: data.open[i],
+                high: data.high[i],
+                low: data.low[i],
+                close: data.close[i],
+                volume: data.volume[i]
+            }};
         }}
 
-        // Convert volume to depth (3D effect)
-        function volumeToDepth(volume) {{
-            if (maxVolume === 0) return 0;
-            return Math.max(2, (volume / maxVolume) * 20); // Max depth of 20 pixels
-        }}
+        // Canvas setup: the renderer draws the chart on chartCanvas, the page
+        // draws the hover line on the overlay stacked above it
+        const canvas = document.getElementById('chartCanvas');
+        const overlay = document.getElementById('overlayCanvas');
+        const overlayCtx = overlay.getContext('2d');
+        const tooltip = document.getElementById('tooltip');
 
-        // Draw axis
-        function drawAxes() {{
-            ctx.strokeStyle = '#333';
-            ctx.lineWidth = 2;
-
-            // Y-axis (price) - on the right side
-            const yAxisX = chartX + chartWidth;
-            ctx.beginPath();
-            ctx.moveTo(yAxisX, chartY);
-            ctx.lineTo(yAxisX, chartY + chartHeight);
-            ctx.stroke();
-
-            // X-axis (date)
-            ctx.beginPath();
-            ctx.moveTo(chartX, chartY + chartHeight);
-            ctx.lineTo(chartX + chartWidth, chartY + chartHeight);
-            ctx.stroke();
-
-            // Y-axis labels - on the right side
-            ctx.fillStyle = '#333';
-            ctx.font = '12px Arial';
-            ctx.textAlign = 'left';
-            ctx.textBaseline = 'middle';
-
-            const numLabels = 10;
-            for (let i = 0; i <= numLabels; i++) {{
-                const price = minPrice + (priceRange * i / numLabels);
-                const y = priceToY(price);
-                ctx.fillText('₹' + price.toFixed(2), yAxisX + 10, y);
-                
-                // Grid line
-                ctx.strokeStyle = '#e0e0e0';
-                ctx.lineWidth = 1;
-                ctx.beginPath();
-                ctx.moveTo(chartX, y);
-                ctx.lineTo(chartX + chartWidth, y);
-                ctx.stroke();
+        // Chart renderer. Its source runs as a Web Worker drawing on an
+        // OffscreenCanvas, or is called directly on the page when workers or
+        // OffscreenCanvas are unavailable. Either way it only talks to the page
+        // through messages: 'init' once, then one 'frame' per redraw, each
+        // answered with the drawn candle rects and chart layout.
+        function chartRenderer(scope) {{
+            let canvas, ctx, data, indicators, predictions;
+            let minPrice, maxPrice, maxVolume, dataLength;
+
+            // Chart dimensions - Y-axis on the right
+            const padding = {{ top: 50, right: 100, bottom: 80, left: 80 }};
+            let chartWidth, chartHeight, chartX, chartY;
+
+            // Minimum horizontal distance (px) between drawn candles
+            const MIN_CANDLE_SPACING = 2;
+
+            function updateDimensions() {{
+                chartWidth = canvas.width - padding.left - padding.right;
+                chartHeight = canvas.height - padding.top - padding.bottom;
+                chartX = padding.left;
+                chartY = padding.top;
             }}
 
-            // X-axis labels (dates)
-            ctx.textAlign = 'center';
-            ctx.textBaseline = 'top';
-            ctx.strokeStyle = '#333';
-            ctx.lineWidth = 2;
-            ctx.fillStyle = '#333';
-
-            const dateStep = Math.max(1, Math.floor(dataLength / 12));
-            for (let i = 0; i < dataLength; i += dateStep) {{
-                const x = indexToX(i);
-                const date = new Date(data[i].date + 'T00:00:00');
-                const dateStr = date.toLocaleDateString('en-US', {{ month: 'short', day: 'numeric' }});
-                
-                ctx.fillText(dateStr, x, chartY + chartHeight + 10);
-                
-                // Grid line
-                ctx.strokeStyle = '#e0e0e0';
-                ctx.lineWidth = 1;
-                ctx.beginPath();
-                ctx.moveTo(x, chartY);
-                ctx.lineTo(x, chartY + chartHeight);
-                ctx.stroke();
-            }}
-        }}
+            // X-axis date labels by day number; a label is formatted the first
+            // time its date is drawn and reused by later frames
+            const dateFormat = new Intl.DateTimeFormat('en-US', {{ month: 'short', day: 'numeric', timeZone: 'UTC' }});
+            const dateLabels = new Map();
 
-        // Draw 3D candlestick
-        function drawCandle(index, candle, x, depth) {{
-            // Validate inputs
-            if (!candle || typeof candle.open !== 'number' || typeof candle.close !== 'number') {{
-                console.warn('Invalid candle data at index', index, candle);
-                return null;
-            }}
-            
-            const openY = priceToY(candle.open);
-            const closeY = priceToY(candle.close);
-            const highY = priceToY(candle.high);
-            const lowY = priceToY(candle.low);
-            
-            // Validate Y coordinates
-            if (isNaN(openY) || isNaN(closeY) || isNaN(highY) || isNaN(lowY) || isNaN(x)) {{
-                console.warn('Invalid coordinates at index', index, {{openY, closeY, highY, lowY, x}});
-                return null;
-            }}
-            
-            const isBullish = candle.close > candle.open;
-            const bodyTop = Math.min(openY, closeY);
-            const bodyBottom = Math.max(openY, closeY);
-            const bodyHeight = Math.max(1, bodyBottom - bodyTop);
-            const candleWidth = Math.max(2, (chartWidth / dataLength) * 0.8);
-
-            // Draw wick (high-low line)
-            ctx.strokeStyle = isBullish ? '#4CAF50' : '#f44336';
-            ctx.lineWidth = 2;
-            ctx.beginPath();
-            ctx.moveTo(x + candleWidth / 2, highY);
-            ctx.lineTo(x + candleWidth / 2, lowY);
-            ctx.stroke();
-
-            // Draw 3D body
-            if (isBullish) {{
-                // Bullish (green)
-                ctx.fillStyle = '#4CAF50';
-                ctx.strokeStyle = '#2e7d32';
-                ctx.lineWidth = 2;
-            }} else {{
-                // Bearish (red)
-                ctx.fillStyle = '#f44336';
-                ctx.strokeStyle = '#c62828';
-                ctx.lineWidth = 2;
+            function dateLabel(day) {{
+                let label = dateLabels.get(day);
+                if (label === undefined) {{
+                    label = dateFormat.format(day * 86400000);
+                    dateLabels.set(day, label);
+                }}
+                return label;
             }}
 
-            // Draw body
-            ctx.beginPath();
-            ctx.rect(x, bodyTop, candleWidth, bodyHeight);
-            ctx.fill();
-            ctx.stroke();
-
-            // 3D depth effect - draw side faces
-            if (depth > 0) {{
-                ctx.fillStyle = isBullish ? 'rgba(76, 175, 80, 0.5)' : 'rgba(244, 67, 54, 0.5)';
-                
-                // Right face
-                ctx.beginPath();
-                ctx.moveTo(x + candleWidth, bodyTop);
-                ctx.lineTo(x + candleWidth + depth, bodyTop - depth);
-                ctx.lineTo(x + candleWidth + depth, bodyBottom - depth);
-                ctx.lineTo(x + candleWidth, bodyBottom);
-                ctx.closePath();
-                ctx.fill();
-
-                // Top face
-                ctx.beginPath();
-                ctx.moveTo(x, bodyTop);
-                ctx.lineTo(x + depth, bodyTop - depth);
-                ctx.lineTo(x + candleWidth + depth, bodyTop - depth);
-                ctx.lineTo(x + candleWidth, bodyTop);
-                ctx.closePath();
-                ctx.fill();
-
-                // Shadow
-                ctx.fillStyle = 'rgba(0, 0, 0, 0.15)';
-                ctx.beginPath();
-                ctx.rect(x + depth, chartY + chartHeight - depth, candleWidth, depth);
-                ctx.fill();
+            // Convert volume to depth (3D effect)
+            function volumeToDepth(volume) {{
+                if (maxVolume === 0) return 0;
+                return Math.max(2, (volume / maxVolume) * 20); // Max depth of 20 pixels
             }}
 
-            return {{
-                x: x,
-                y: Math.min(highY, bodyTop),
-                width: candleWidth + depth,
-                height: Math.abs(lowY - highY),
-                index: index,
-                candle: candle
-            }};
-        }}
-
-        // Draw Moving Average (MA10)
-        function drawMA10() {{
-            if (!indicators || !indicators.ma10) return;
-            
-            ctx.strokeStyle = '#f44336';
-            ctx.lineWidth = 2;
-            ctx.beginPath();
-            
-            let firstPoint = true;
-            for (let i = 0; i < indicators.ma10.length; i++) {{
-                const ma = indicators.ma10[i];
-                if (ma && ma.ma !== null && ma.ma !== undefined) {{
-                    const x = indexToX(i);
-                    const y = priceToY(ma.ma);
-                    
+            // Trace a projected series into a path, skipping missing (NaN) points
+            function traceSeries(path, xs, ys) {{
+                let firstPoint = true;
+                for (let k = 0; k < ys.length; k++) {{
+                    const y = ys[k];
+                    if (isNaN(y)) continue;
                     if (firstPoint) {{
-                        ctx.moveTo(x, y);
+                        path.moveTo(xs[k], y);
                         firstPoint = false;
                     }} else {{
-                        ctx.lineTo(x, y);
+                        path.lineTo(xs[k], y);
                     }}
                 }}
             }}
-            ctx.stroke();
-        }}
 
-        // Draw Bollinger Bands
-        function drawBollingerBands() {{
-            if (!indicators || !indicators.bollingerBands) return;
-            
-            const bb = indicators.bollingerBands;
-            
-            // Draw upper band
-            ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)';
-            ctx.lineWidth = 1.5;
-            ctx.setLineDash([5, 5]);
-            ctx.beginPath();
-            let firstPoint = true;
-            for (let i = 0; i < bb.length; i++) {{
-                if (bb[i] && bb[i].upper !== null) {{
-                    const x = indexToX(i);
-                    const y = priceToY(bb[i].upper);
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
-                    }}
+            // Project an indicator series onto the visible range (NaN stays NaN)
+            function projectSeries(values, view) {{
+                const ys = new Float64Array(view.count);
+                for (let k = 0; k < view.count; k++) {{
+                    ys[k] = view.priceToY(values[view.start + k]);
                 }}
+                return ys;
             }}
-            ctx.stroke();
-            
-            // Draw middle band (SMA)
-            ctx.strokeStyle = 'rgba(255, 152, 0, 0.8)';
-            ctx.lineWidth = 1.5;
-            ctx.beginPath();
-            firstPoint = true;
-            for (let i = 0; i < bb.length; i++) {{
-                if (bb[i] && bb[i].middle !== null) {{
-                    const x = indexToX(i);
-                    const y = priceToY(bb[i].middle);
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
-                    }}
-                }}
+
+            // Build a Path2D for a series over the visible range
+            function seriesPath(values, view) {{
+                const path = new Path2D();
+                traceSeries(path, view.xs, projectSeries(values, view));
+                return path;
             }}
-            ctx.stroke();
-            
-            // Draw lower band
-            ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)';
-            ctx.lineWidth = 1.5;
-            ctx.beginPath();
-            firstPoint = true;
-            for (let i = 0; i < bb.length; i++) {{
-                if (bb[i] && bb[i].lower !== null) {{
-                    const x = indexToX(i);
-                    const y = priceToY(bb[i].lower);
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
+
+            // Build the indicator paths for one view (null where an indicator is missing)
+            function buildIndicatorPaths(view) {{
+                const paths = {{ vwap: null, ma10: null, bbUpper: null, bbMiddle: null, bbLower: null, bbFill: null }};
+                if (!indicators) return paths;
+                if (indicators.vwap) paths.vwap = seriesPath(indicators.vwap, view);
+                if (indicators.ma10) paths.ma10 = seriesPath(indicators.ma10, view);
+                if (indicators.bbUpper) {{
+                    // One pass over the bands builds all three lines and the top
+                    // edge of the fill; only the lower edge is walked again
+                    const xs = view.xs;
+                    const bbUpper = indicators.bbUpper;
+                    const bbMiddle = indicators.bbMiddle;
+                    const bbLower = indicators.bbLower;
+                    const upper = new Path2D();
+                    const middle = new Path2D();
+                    const lower = new Path2D();
+                    const fill = new Path2D();
+                    const lowerY = new Float64Array(view.count);
+                    let upperStarted = false;
+                    let middleStarted = false;
+                    let lowerStarted = false;
+                    let fillStarted = false;
+                    for (let k = 0; k < view.count; k++) {{
+                        const i = view.start + k;
+                        const x = xs[k];
+                        const u = view.priceToY(bbUpper[i]);
+                        const m = view.priceToY(bbMiddle[i]);
+                        const l = view.priceToY(bbLower[i]);
+                        lowerY[k] = l;
+                        if (!isNaN(u)) {{
+                            if (upperStarted) upper.lineTo(x, u); else upper.moveTo(x, u);
+                            upperStarted = true;
+                        }}
+                        if (!isNaN(m)) {{
+                            if (middleStarted) middle.lineTo(x, m); else middle.moveTo(x, m);
+                            middleStarted = true;
+                        }}
+                        if (!isNaN(l)) {{
+                            if (lowerStarted) lower.lineTo(x, l); else lower.moveTo(x, l);
+                            lowerStarted = true;
+                        }}
+                        // Area between bands: along the upper band, back along the lower
+                        if (!isNaN(u) && !isNaN(l)) {{
+                            if (fillStarted) fill.lineTo(x, u); else fill.moveTo(x, u);
+                            fillStarted = true;
+                        }}
                     }}
-                }}
-            }}
-            ctx.stroke();
-            ctx.setLineDash([]);
-            
-            // Fill between bands
-            ctx.fillStyle = 'rgba(255, 152, 0, 0.1)';
-            ctx.beginPath();
-            firstPoint = true;
-            for (let i = 0; i < bb.length; i++) {{
-                if (bb[i] && bb[i].upper !== null && bb[i].lower !== null) {{
-                    const x = indexToX(i);
-                    const upperY = priceToY(bb[i].upper);
-                    const lowerY = priceToY(bb[i].lower);
-                    if (firstPoint) {{
-                        ctx.moveTo(x, upperY);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, upperY);
+                    for (let k = view.count - 1; k >= 0; k--) {{
+                        const i = view.start + k;
+                        if (isNaN(lowerY[k]) || isNaN(bbUpper[i])) continue;
+                        fill.lineTo(xs[k], lowerY[k]);
                     }}
+                    fill.closePath();
+                    paths.bbUpper = upper;
+                    paths.bbMiddle = middle;
+                    paths.bbLower = lower;
+                    paths.bbFill = fill;
                 }}
+                return paths;
             }}
-            for (let i = bb.length - 1; i >= 0; i--) {{
-                if (bb[i] && bb[i].upper !== null && bb[i].lower !== null) {{
-                    const x = indexToX(i);
-                    const lowerY = priceToY(bb[i].lower);
-                    ctx.lineTo(x, lowerY);
-                }}
-            }}
-            ctx.closePath();
-            ctx.fill();
-        }}
 
-        // Draw VWAP
-        function drawVWAP() {{
-            if (!indicators || !indicators.vwap) return;
-            
-            ctx.strokeStyle = '#FFC107';
-            ctx.lineWidth = 2;
-            ctx.setLineDash([3, 3]);
-            ctx.beginPath();
-            
-            let firstPoint = true;
-            for (let i = 0; i < indicators.vwap.length; i++) {{
-                const vwap = indicators.vwap[i];
-                if (vwap && vwap.vwap !== null && vwap.vwap !== undefined && !isNaN(vwap.vwap)) {{
-                    const x = indexToX(i);
-                    const y = priceToY(vwap.vwap);
-                    
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
+            // Indicator paths of recently drawn views, least recently used first.
+            // A view is fully determined by the visible range and canvas size.
+            const pathCache = new Map();
+            const PATH_CACHE_SIZE = 8;
+
+            function indicatorPaths(view) {{
+                const key = view.start + '|' + view.count + '|' + canvas.width + '|' + canvas.height;
+                let paths = pathCache.get(key);
+                if (paths) {{
+                    pathCache.delete(key);
+                }} else {{
+                    paths = buildIndicatorPaths(view);
+                    if (pathCache.size >= PATH_CACHE_SIZE) {{
+                        pathCache.delete(pathCache.keys().next().value);
                     }}
                 }}
+                pathCache.set(key, paths);
+                return paths;
             }}
-            ctx.stroke();
-            ctx.setLineDash([]);
-        }}
         
-        // Draw VWAP for visible range
-        function drawVWAPForRange(startIdx, endIdx, minP, maxP, priceRng) {{
-            if (!indicators || !indicators.vwap) return;
+            // Draw VWAP
+            function drawVWAP(paths) {{
+                if (!paths.vwap) return;
             
-            const priceToYLocal = (price) => chartY + chartHeight - ((price - minP) / priceRng) * chartHeight;
-            const indexToXLocal = (idx) => {{
-                const visible = getVisibleRange();
-                if (visible.count <= 1) return chartX;
-                const relativeIdx = idx - visible.start;
-                return chartX + (relativeIdx / (visible.count - 1)) * chartWidth;
-            }};
-            
-            ctx.strokeStyle = '#FFC107';
-            ctx.lineWidth = 2;
-            ctx.setLineDash([3, 3]);
-            ctx.beginPath();
-            
-            let firstPoint = true;
-            for (let i = startIdx; i < endIdx && i < indicators.vwap.length; i++) {{
-                const vwap = indicators.vwap[i];
-                if (vwap && vwap.vwap !== null && vwap.vwap !== undefined && !isNaN(vwap.vwap)) {{
-                    const x = indexToXLocal(i);
-                    const y = priceToYLocal(vwap.vwap);
-                    
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
-                    }}
-                }}
+                ctx.strokeStyle = '#FFC107';
+                ctx.lineWidth = 2;
+                ctx.setLineDash([3, 3]);
+                ctx.stroke(paths.vwap);
+                ctx.setLineDash([]);
             }}
-            ctx.stroke();
-            ctx.setLineDash([]);
-        }}
         
-        // Draw MA10 for visible range
-        function drawMA10ForRange(startIdx, endIdx, minP, maxP, priceRng) {{
-            if (!indicators || !indicators.ma10) return;
+            // Draw MA10
+            function drawMA10(paths) {{
+                if (!paths.ma10) return;
             
-            const priceToYLocal = (price) => chartY + chartHeight - ((price - minP) / priceRng) * chartHeight;
-            const indexToXLocal = (idx) => {{
-                const visible = getVisibleRange();
-                if (visible.count <= 1) return chartX;
-                const relativeIdx = idx - visible.start;
-                return chartX + (relativeIdx / (visible.count - 1)) * chartWidth;
-            }};
-            
-            ctx.strokeStyle = '#f44336';
-            ctx.lineWidth = 2;
-            ctx.beginPath();
-            
-            let firstPoint = true;
-            for (let i = startIdx; i < endIdx && i < indicators.ma10.length; i++) {{
-                const ma = indicators.ma10[i];
-                if (ma && ma.ma !== null && ma.ma !== undefined && !isNaN(ma.ma)) {{
-                    const x = indexToXLocal(i);
-                    const y = priceToYLocal(ma.ma);
-                    
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
-                    }}
-                }}
+                ctx.strokeStyle = '#f44336';
+                ctx.lineWidth = 2;
+                ctx.stroke(paths.ma10);
             }}
-            ctx.stroke();
-        }}
         
-        // Draw Bollinger Bands for visible range
-        function drawBollingerBandsForRange(startIdx, endIdx, minP, maxP, priceRng) {{
-            if (!indicators || !indicators.bollingerBands) return;
+            // Draw Bollinger Bands
+            function drawBollingerBands(paths) {{
+                if (!paths.bbUpper) return;
             
-            const bb = indicators.bollingerBands;
-            const priceToYLocal = (price) => chartY + chartHeight - ((price - minP) / priceRng) * chartHeight;
-            const indexToXLocal = (idx) => {{
-                const visible = getVisibleRange();
-                if (visible.count <= 1) return chartX;
-                const relativeIdx = idx - visible.start;
-                return chartX + (relativeIdx / (visible.count - 1)) * chartWidth;
-            }};
-            
-            // Draw upper band
-            ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)';
-            ctx.lineWidth = 1.5;
-            ctx.setLineDash([5, 5]);
-            ctx.beginPath();
-            let firstPoint = true;
-            for (let i = startIdx; i < endIdx && i < bb.length; i++) {{
-                if (bb[i] && bb[i].upper !== null && !isNaN(bb[i].upper)) {{
-                    const x = indexToXLocal(i);
-                    const y = priceToYLocal(bb[i].upper);
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
-                    }}
-                }}
-            }}
-            ctx.stroke();
+                // Draw upper band
+                ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)';
+                ctx.lineWidth = 1.5;
+                ctx.setLineDash([5, 5]);
+                ctx.stroke(paths.bbUpper);
             
-            // Draw middle band
-            ctx.strokeStyle = 'rgba(255, 152, 0, 0.8)';
-            ctx.lineWidth = 1.5;
-            ctx.beginPath();
-            firstPoint = true;
-            for (let i = startIdx; i < endIdx && i < bb.length; i++) {{
-                if (bb[i] && bb[i].middle !== null && !isNaN(bb[i].middle)) {{
-                    const x = indexToXLocal(i);
-                    const y = priceToYLocal(bb[i].middle);
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
-                    }}
-                }}
-            }}
-            ctx.stroke();
+                // Draw middle band
+                ctx.strokeStyle = 'rgba(255, 152, 0, 0.8)';
+                ctx.lineWidth = 1.5;
+                ctx.stroke(paths.bbMiddle);
             
-            // Draw lower band
-            ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)';
-            ctx.lineWidth = 1.5;
-            ctx.beginPath();
-            firstPoint = true;
-            for (let i = startIdx; i < endIdx && i < bb.length; i++) {{
-                if (bb[i] && bb[i].lower !== null && !isNaN(bb[i].lower)) {{
-                    const x = indexToXLocal(i);
-                    const y = priceToYLocal(bb[i].lower);
-                    if (firstPoint) {{
-                        ctx.moveTo(x, y);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, y);
-                    }}
-                }}
-            }}
-            ctx.stroke();
-            ctx.setLineDash([]);
+                // Draw lower band
+                ctx.strokeStyle = 'rgba(255, 152, 0, 0.6)';
+                ctx.lineWidth = 1.5;
+                ctx.stroke(paths.bbLower);
+                ctx.setLineDash([]);
             
-            // Fill between bands
-            ctx.fillStyle = 'rgba(255, 152, 0, 0.1)';
-            ctx.beginPath();
-            firstPoint = true;
-            for (let i = startIdx; i < endIdx && i < bb.length; i++) {{
-                if (bb[i] && bb[i].upper !== null && bb[i].lower !== null && !isNaN(bb[i].upper) && !isNaN(bb[i].lower)) {{
-                    const x = indexToXLocal(i);
-                    const upperY = priceToYLocal(bb[i].upper);
-                    if (firstPoint) {{
-                        ctx.moveTo(x, upperY);
-                        firstPoint = false;
-                    }} else {{
-                        ctx.lineTo(x, upperY);
-                    }}
-                }}
+                // Fill between bands
+                ctx.fillStyle = 'rgba(255, 152, 0, 0.1)';
+                ctx.fill(paths.bbFill);
             }}
-            for (let i = endIdx - 1; i >= startIdx && i >= 0 && i < bb.length; i--) {{
-                if (bb[i] && bb[i].upper !== null && bb[i].lower !== null && !isNaN(bb[i].upper) && !isNaN(bb[i].lower)) {{
-                    const x = indexToXLocal(i);
-                    const lowerY = priceToYLocal(bb[i].lower);
-                    ctx.lineTo(x, lowerY);
-                }}
-            }}
-            ctx.closePath();
-            ctx.fill();
-        }}
         
-        // Draw axes with custom price range
-        function drawAxesWithRange(minP, maxP, priceRng) {{
-            ctx.strokeStyle = '#333';
-            ctx.lineWidth = 2;
-
-            // Y-axis (price) - on the right side
-            const yAxisX = chartX + chartWidth;
-            ctx.beginPath();
-            ctx.moveTo(yAxisX, chartY);
-            ctx.lineTo(yAxisX, chartY + chartHeight);
-            ctx.stroke();
-
-            // X-axis (date)
-            ctx.beginPath();
-            ctx.moveTo(chartX, chartY + chartHeight);
-            ctx.lineTo(chartX + chartWidth, chartY + chartHeight);
-            ctx.stroke();
-
-            // Y-axis labels - on the right side
-            ctx.fillStyle = '#333';
-            ctx.font = '12px Arial';
-            ctx.textAlign = 'left';
-            ctx.textBaseline = 'middle';
-
-            const numLabels = 10;
-            for (let i = 0; i <= numLabels; i++) {{
-                const price = minP + (priceRng * i / numLabels);
-                const y = chartY + chartHeight - ((price - minP) / priceRng) * chartHeight;
-                ctx.fillText('₹' + price.toFixed(2), yAxisX + 10, y);
-                
-                // Grid line
-                ctx.strokeStyle = '#e0e0e0';
-                ctx.lineWidth = 1;
+            // Draw axes with custom price range
+            function drawAxesWithRange(view) {{
+                ctx.strokeStyle = '#333';
+                ctx.lineWidth = 2;
+
+                // Y-axis (price) - on the right side
+                const yAxisX = chartX + chartWidth;
                 ctx.beginPath();
-                ctx.moveTo(chartX, y);
-                ctx.lineTo(chartX + chartWidth, y);
+                ctx.moveTo(yAxisX, chartY);
+                ctx.lineTo(yAxisX, chartY + chartHeight);
                 ctx.stroke();
-            }}
 
-            // X-axis labels (dates)
-            ctx.textAlign = 'center';
-            ctx.textBaseline = 'top';
-            ctx.strokeStyle = '#333';
-            ctx.lineWidth = 2;
-            ctx.fillStyle = '#333';
+                // X-axis (date)
+                ctx.beginPath();
+                ctx.moveTo(chartX, chartY + chartHeight);
+                ctx.lineTo(chartX + chartWidth, chartY + chartHeight);
+                ctx.stroke();
 
-            const visible = getVisibleRange();
-            const dateStep = Math.max(1, Math.floor(visible.count / 12));
-            for (let i = visible.start; i < visible.end; i += dateStep) {{
-                const x = indexToX(i);
-                const date = new Date(data[i].date + 'T00:00:00');
-                const dateStr = date.toLocaleDateString('en-US', {{ month: 'short', day: 'numeric' }});
+                // Y-axis labels - on the right side
+                ctx.fillStyle = '#333';
+                ctx.font = '12px Arial';
+                ctx.textAlign = 'left';
+                ctx.textBaseline = 'middle';
+
+                const numLabels = 10;
+                for (let i = 0; i <= numLabels; i++) {{
+                    const price = view.minPrice + (view.priceRange * i / numLabels);
+                    const y = view.priceToY(price);
+                    ctx.fillText('₹' + price.toFixed(2), yAxisX + 10, y);
                 
-                ctx.fillText(dateStr, x, chartY + chartHeight + 10);
+                    // Grid line
+                    ctx.strokeStyle = '#e0e0e0';
+                    ctx.lineWidth = 1;
+                    ctx.beginPath();
+                    ctx.moveTo(chartX, y);
+                    ctx.lineTo(chartX + chartWidth, y);
+                    ctx.stroke();
+                }}
+
+                // X-axis labels (dates)
+                ctx.textAlign = 'center';
+                ctx.textBaseline = 'top';
+                ctx.strokeStyle = '#333';
+                ctx.lineWidth = 2;
+                ctx.fillStyle = '#333';
+
+                const dateStep = Math.max(1, Math.floor(view.count / 12));
+                for (let i = view.start; i < view.end; i += dateStep) {{
+                    const x = view.xs[i - view.start];
+                    const dateStr = dateLabel(data.day[i]);
                 
-                // Grid line
-                ctx.strokeStyle = '#e0e0e0';
-                ctx.lineWidth = 1;
-                ctx.beginPath();
-                ctx.moveTo(x, chartY);
-                ctx.lineTo(x, chartY + chartHeight);
-                ctx.stroke();
+                    ctx.fillText(dateStr, x, chartY + chartHeight + 10);
+                
+                    // Grid line
+                    ctx.strokeStyle = '#e0e0e0';
+                    ctx.lineWidth = 1;
+                    ctx.beginPath();
+                    ctx.moveTo(x, chartY);
+                    ctx.lineTo(x, chartY + chartHeight);
+                    ctx.stroke();
+                }}
             }}
-        }}
         
-        // Draw prediction markers
-        function drawPredictionMarkers(startIdx, endIdx, minP, maxP, priceRng) {{
-            if (!predictions || predictions.length === 0) return;
-            
-            const priceToYLocal = (price) => chartY + chartHeight - ((price - minP) / priceRng) * chartHeight;
-            const indexToXLocal = (idx) => {{
-                const visible = getVisibleRange();
-                if (visible.count <= 1) return chartX;
-                const relativeIdx = idx - visible.start;
-                return chartX + (relativeIdx / (visible.count - 1)) * chartWidth;
-            }};
+            // Draw prediction markers
+            function drawPredictionMarkers(view) {{
+                if (!predictions || predictions.length === 0) return;
             
-            for (let i = startIdx; i < endIdx && i < predictions.length; i++) {{
-                const pred = predictions[i];
-                if (!pred || !pred.prediction) continue;
+                const candleWidth = view.candleWidth;
+                for (let i = view.start; i < view.end && i < predictions.length; i++) {{
+                    const pred = predictions[i];
+                    if (!pred || !pred.prediction) continue;
+                    if (i >= dataLength) continue;
                 
-                const candle = data[i];
-                if (!candle) continue;
+                    const x = view.xs[i - view.start];
+                    const markerSize = 8;
+                    const markerOffset = 5;
+                    const textOffset = 15;
                 
-                const x = indexToXLocal(i);
-                const candleWidth = Math.max(2, (chartWidth / (endIdx - startIdx)) * 0.8);
-                const markerSize = 8;
-                const markerOffset = 5;
-                const textOffset = 15;
-                
-                if (pred.prediction === 'fall') {{
-                    // Red marker above candle (expected to fall)
-                    const highY = priceToYLocal(candle.high);
-                    const markerY = highY - markerOffset - markerSize;
-                    const textY = markerY - textOffset;
-                    
-                    ctx.fillStyle = '#f44336';
-                    ctx.strokeStyle = '#c62828';
-                    ctx.lineWidth = 2;
+                    if (pred.prediction === 'fall') {{
+                        // Red marker above candle (expected to fall)
+                        const highY = view.priceToY(data.high[i]);
+                        const markerY = highY - markerOffset - markerSize;
+                        const textY = markerY - textOffset;
                     
-                    // Draw downward triangle
-                    ctx.beginPath();
-                    ctx.moveTo(x + candleWidth / 2, markerY);
-                    ctx.lineTo(x + candleWidth / 2 - markerSize, markerY + markerSize);
-                    ctx.lineTo(x + candleWidth / 2 + markerSize, markerY + markerSize);
-                    ctx.closePath();
-                    ctx.fill();
-                    ctx.stroke();
-                    
-                    // Draw case name text above marker
-                    if (pred.case_name) {{
                         ctx.fillStyle = '#f44336';
-                        ctx.font = '10px Arial';
-                        ctx.textAlign = 'center';
-                        ctx.textBaseline = 'bottom';
-                        ctx.fillText(pred.case_name, x + candleWidth / 2, textY);
-                    }}
-                }} else if (pred.prediction === 'rise') {{
-                    // Green marker below candle (expected to rise)
-                    const lowY = priceToYLocal(candle.low);
-                    const markerY = lowY + markerOffset + markerSize;
-                    const textY = markerY + textOffset;
+                        ctx.strokeStyle = '#c62828';
+                        ctx.lineWidth = 2;
                     
-                    ctx.fillStyle = '#4CAF50';
-                    ctx.strokeStyle = '#2e7d32';
-                    ctx.lineWidth = 2;
+                        // Draw downward triangle
+                        ctx.beginPath();
+                        ctx.moveTo(x + candleWidth / 2, markerY);
+                        ctx.lineTo(x + candleWidth / 2 - markerSize, markerY + markerSize);
+                        ctx.lineTo(x + candleWidth / 2 + markerSize, markerY + markerSize);
+                        ctx.closePath();
+                        ctx.fill();
+                        ctx.stroke();
                     
-                    // Draw upward triangle
-                    ctx.beginPath();
-                    ctx.moveTo(x + candleWidth / 2, markerY);
-                    ctx.lineTo(x + candleWidth / 2 - markerSize, markerY - markerSize);
-                    ctx.lineTo(x + candleWidth / 2 + markerSize, markerY - markerSize);
-                    ctx.closePath();
-                    ctx.fill();
-                    ctx.stroke();
+                        // Draw case name text above marker
+                        if (pred.case_name) {{
+                            ctx.fillStyle = '#f44336';
+                            ctx.font = '10px Arial';
+                            ctx.textAlign = 'center';
+                            ctx.textBaseline = 'bottom';
+                            ctx.fillText(pred.case_name, x + candleWidth / 2, textY);
+                        }}
+                    }} else if (pred.prediction === 'rise') {{
+                        // Green marker below candle (expected to rise)
+                        const lowY = view.priceToY(data.low[i]);
+                        const markerY = lowY + markerOffset + markerSize;
+                        const textY = markerY + textOffset;
                     
-                    // Draw case name text below marker
-                    if (pred.case_name) {{
                         ctx.fillStyle = '#4CAF50';
-                        ctx.font = '10px Arial';
-                        ctx.textAlign = 'center';
-                        ctx.textBaseline = 'top';
-                        ctx.fillText(pred.case_name, x + candleWidth / 2, textY);
+                        ctx.strokeStyle = '#2e7d32';
+                        ctx.lineWidth = 2;
+                    
+                        // Draw upward triangle
+                        ctx.beginPath();
+                        ctx.moveTo(x + candleWidth / 2, markerY);
+                        ctx.lineTo(x + candleWidth / 2 - markerSize, markerY - markerSize);
+                        ctx.lineTo(x + candleWidth / 2 + markerSize, markerY - markerSize);
+                        ctx.closePath();
+                        ctx.fill();
+                        ctx.stroke();
+                    
+                        // Draw case name text below marker
+                        if (pred.case_name) {{
+                            ctx.fillStyle = '#4CAF50';
+                            ctx.font = '10px Arial';
+                            ctx.textAlign = 'center';
+                            ctx.textBaseline = 'top';
+                            ctx.fillText(pred.case_name, x + candleWidth / 2, textY);
+                        }}
                     }}
                 }}
             }}
-        }}
         
-        // Draw candle for visible range
-        function drawCandleForRange(index, candle, x, depth, minP, maxP, priceRng) {{
-            const priceToYLocal = (price) => chartY + chartHeight - ((price - minP) / priceRng) * chartHeight;
-            
-            // Validate inputs
-            if (!candle || typeof candle.open !== 'number' || typeof candle.close !== 'number') {{
-                return null;
+            // Merge the visible candles into buckets of `size` consecutive candles:
+            // first open, highest high, lowest low, last close, and the largest
+            // volume (so the depth effect stays in range). index holds the first
+            // data index of each bucket.
+            function decimateCandles(visible, size) {{
+                const n = Math.ceil(visible.count / size);
+                const bars = {{
+                    open: new Float32Array(n),
+                    high: new Float32Array(n),
+                    low: new Float32Array(n),
+                    close: new Float32Array(n),
+                    volume: new Float64Array(n),
+                    index: new Int32Array(n)
+                }};
+                for (let b = 0; b < n; b++) {{
+                    const first = visible.start + b * size;
+                    const last = Math.min(first + size, visible.end) - 1;
+                    let high = -Infinity;
+                    let low = Infinity;
+                    let volume = 0;
+                    for (let i = first; i <= last; i++) {{
+                        if (data.high[i] > high) high = data.high[i];
+                        if (data.low[i] < low) low = data.low[i];
+                        if (data.volume[i] > volume) volume = data.volume[i];
+                    }}
+                    bars.open[b] = data.open[first];
+                    bars.high[b] = high === -Infinity ? NaN : high;
+                    bars.low[b] = low === Infinity ? NaN : low;
+                    bars.close[b] = data.close[last];
+                    bars.volume[b] = volume;
+                    bars.index[b] = first;
+                }}
+                return bars;
             }}
-            
-            const openY = priceToYLocal(candle.open);
-            const closeY = priceToYLocal(candle.close);
-            const highY = priceToYLocal(candle.high);
-            const lowY = priceToYLocal(candle.low);
-            
-            // Validate Y coordinates
-            if (isNaN(openY) || isNaN(closeY) || isNaN(highY) || isNaN(lowY) || isNaN(x)) {{
-                return null;
+        
+            // Candle geometry is collected into one Path2D per color and part
+            // so a frame issues a fixed handful of fill/stroke calls
+            function newCandleBatch() {{
+                return {{
+                    bullWick: new Path2D(),
+                    bearWick: new Path2D(),
+                    bullBody: new Path2D(),
+                    bearBody: new Path2D(),
+                    bullFace: new Path2D(),
+                    bearFace: new Path2D(),
+                    shadow: new Path2D()
+                }};
             }}
-            
-            const isBullish = candle.close > candle.open;
-            const bodyTop = Math.min(openY, closeY);
-            const bodyBottom = Math.max(openY, closeY);
-            const bodyHeight = Math.max(1, bodyBottom - bodyTop);
-            const visible = getVisibleRange();
-            const candleWidth = Math.max(2, (chartWidth / visible.count) * 0.8);
-
-            // Draw wick (high-low line)
-            ctx.strokeStyle = isBullish ? '#4CAF50' : '#f44336';
-            ctx.lineWidth = 2;
-            ctx.beginPath();
-            ctx.moveTo(x + candleWidth / 2, highY);
-            ctx.lineTo(x + candleWidth / 2, lowY);
-            ctx.stroke();
-
-            // Draw 3D body
-            if (isBullish) {{
+
+            function drawCandleBatch(batch) {{
+                ctx.lineWidth = 2;
+
+                // Wicks (high-low lines)
+                ctx.strokeStyle = '#4CAF50';
+                ctx.stroke(batch.bullWick);
+                ctx.strokeStyle = '#f44336';
+                ctx.stroke(batch.bearWick);
+
+                // Bodies
                 ctx.fillStyle = '#4CAF50';
                 ctx.strokeStyle = '#2e7d32';
-                ctx.lineWidth = 2;
-            }} else {{
+                ctx.fill(batch.bullBody);
+                ctx.stroke(batch.bullBody);
                 ctx.fillStyle = '#f44336';
                 ctx.strokeStyle = '#c62828';
-                ctx.lineWidth = 2;
-            }}
-
-            // Draw body
-            ctx.beginPath();
-            ctx.rect(x, bodyTop, candleWidth, bodyHeight);
-            ctx.fill();
-            ctx.stroke();
-
-            // 3D depth effect - draw side faces
-            if (depth > 0) {{
-                ctx.fillStyle = isBullish ? 'rgba(76, 175, 80, 0.5)' : 'rgba(244, 67, 54, 0.5)';
-                
-                // Right face
-                ctx.beginPath();
-                ctx.moveTo(x + candleWidth, bodyTop);
-                ctx.lineTo(x + candleWidth + depth, bodyTop - depth);
-                ctx.lineTo(x + candleWidth + depth, bodyBottom - depth);
-                ctx.lineTo(x + candleWidth, bodyBottom);
-                ctx.closePath();
-                ctx.fill();
-
-                // Top face
-                ctx.beginPath();
-                ctx.moveTo(x, bodyTop);
-                ctx.lineTo(x + depth, bodyTop - depth);
-                ctx.lineTo(x + candleWidth + depth, bodyTop - depth);
-                ctx.lineTo(x + candleWidth, bodyTop);
-                ctx.closePath();
-                ctx.fill();
-
-                // Shadow
+                ctx.fill(batch.bearBody);
+                ctx.stroke(batch.bearBody);
+
+                // 3D side faces and shadows
+                ctx.fillStyle = 'rgba(76, 175, 80, 0.5)';
+                ctx.fill(batch.bullFace);
+                ctx.fillStyle = 'rgba(244, 67, 54, 0.5)';
+                ctx.fill(batch.bearFace);
                 ctx.fillStyle = 'rgba(0, 0, 0, 0.15)';
-                ctx.beginPath();
-                ctx.rect(x + depth, chartY + chartHeight - depth, candleWidth, depth);
-                ctx.fill();
+                ctx.fill(batch.shadow);
             }}
 
-            return {{
-                x: x,
-                y: Math.min(highY, bodyTop),
-                width: candleWidth + depth,
-                height: Math.abs(lowY - highY),
-                index: index,
-                candle: candle
-            }};
-        }}
+            // Add candle j of the column arrays `bars` (the data itself or merged
+            // buckets) to `batch`; `index` is the data index reported for hover
+            function addCandleToBatch(batch, bars, j, index, x, depth, candleWidth, view) {{
+                const yBase = view.yBase;
+                const yScale = view.yScale;
+                const minP = view.minPrice;
+                const open = bars.open[j];
+                const close = bars.close[j];
+            
+                // Validate inputs
+                if (typeof open !== 'number' || typeof close !== 'number') {{
+                    return null;
+                }}
+            
+                const openY = yBase - (open - minP) * yScale;
+                const closeY = yBase - (close - minP) * yScale;
+                const highY = yBase - (bars.high[j] - minP) * yScale;
+                const lowY = yBase - (bars.low[j] - minP) * yScale;
+            
+                // Validate Y coordinates
+                if (isNaN(openY) || isNaN(closeY) || isNaN(highY) || isNaN(lowY) || isNaN(x)) {{
+                    return null;
+                }}
+            
+                const isBullish = close > open;
+                const bodyTop = Math.min(openY, closeY);
+                const bodyBottom = Math.max(openY, closeY);
+                const bodyHeight = Math.max(1, bodyBottom - bodyTop);
+
+                // Wick (high-low line)
+                const wick = isBullish ? batch.bullWick : batch.bearWick;
+                wick.moveTo(x + candleWidth / 2, highY);
+                wick.lineTo(x + candleWidth / 2, lowY);
+
+                // Body
+                (isBullish ? batch.bullBody : batch.bearBody).rect(x, bodyTop, candleWidth, bodyHeight);
+
+                // 3D depth effect - side faces
+                if (depth > 0) {{
+                    const face = isBullish ? batch.bullFace : batch.bearFace;
+                
+                    // Right face
+                    face.moveTo(x + candleWidth, bodyTop);
+                    face.lineTo(x + candleWidth + depth, bodyTop - depth);
+                    face.lineTo(x + candleWidth + depth, bodyBottom - depth);
+                    face.lineTo(x + candleWidth, bodyBottom);
+                    face.closePath();
+
+                    // Top face
+                    face.moveTo(x, bodyTop);
+                    face.lineTo(x + depth, bodyTop - depth);
+                    face.lineTo(x + candleWidth + depth, bodyTop - depth);
+                    face.lineTo(x + candleWidth, bodyTop);
+                    face.closePath();
+
+                    // Shadow
+                    batch.shadow.rect(x + depth, chartY + chartHeight - depth, candleWidth, depth);
+                }}
 
-        // Draw chart
-        function drawChart() {{
-            if (!canvas || !ctx) {{
-                console.error('Canvas not initialized');
-                return;
+                return {{
+                    x: x,
+                    y: Math.min(highY, bodyTop),
+                    width: candleWidth + depth,
+                    height: Math.abs(lowY - highY),
+                    index: index
+                }};
             }}
 
-            if (canvas.width === 0 || canvas.height === 0) {{
-                console.warn('Canvas has zero dimensions, retrying...');
-                setTimeout(resizeCanvas, 100);
-                return;
+            // Lowest low and highest high of the last scanned range; frames that
+            // only resize the canvas reuse it
+            let lastExtent = {{ start: -1, end: -1, min: 0, max: 0 }};
+
+            function visiblePriceExtent(visible) {{
+                if (lastExtent.start !== visible.start || lastExtent.end !== visible.end) {{
+                    let min = Infinity;
+                    let max = -Infinity;
+                    for (let i = visible.start; i < visible.end; i++) {{
+                        const lo = data.low[i];
+                        const hi = data.high[i];
+                        if (lo < min) min = lo;
+                        if (hi > max) max = hi;
+                    }}
+                    lastExtent = {{ start: visible.start, end: visible.end, min: min, max: max }};
+                }}
+                return lastExtent;
             }}
 
-            updateDimensions();
-            ctx.clearRect(0, 0, canvas.width, canvas.height);
+            // Draw chart for the given visible range; returns the candle rects
+            function drawChart(visible) {{
+                if (!canvas || !ctx) {{
+                    console.error('Canvas not initialized');
+                    return [];
+                }}
 
-            if (dataLength === 0) {{
-                ctx.fillStyle = '#333';
-                ctx.font = '20px Arial';
-                ctx.textAlign = 'center';
-                ctx.fillText('No data available', canvas.width / 2, canvas.height / 2);
-                return;
-            }}
+                updateDimensions();
+                ctx.clearRect(0, 0, canvas.width, canvas.height);
 
-            // Calculate visible range based on zoom
-            const visible = getVisibleRange();
-            const visibleData = data.slice(visible.start, visible.end);
+                if (dataLength === 0) {{
+                    ctx.fillStyle = '#333';
+                    ctx.font = '20px Arial';
+                    ctx.textAlign = 'center';
+                    ctx.fillText('No data available', canvas.width / 2, canvas.height / 2);
+                    return [];
+                }}
+
+                // Recalculate price range for visible data only
+                let visibleMinPrice = minPrice;
+                let visibleMaxPrice = maxPrice;
+                if (visible.count > 0) {{
+                    const extent = visiblePriceExtent(visible);
+                    visibleMinPrice = extent.min;
+                    visibleMaxPrice = extent.max;
+                    // Add some padding
+                    const padding = (visibleMaxPrice - visibleMinPrice) * 0.05;
+                    visibleMinPrice -= padding;
+                    visibleMaxPrice += padding;
+                }}
+                const visiblePriceRange = visibleMaxPrice - visibleMinPrice;
             
-            // Recalculate price range for visible data only
-            let visibleMinPrice = minPrice;
-            let visibleMaxPrice = maxPrice;
-            if (visibleData.length > 0) {{
-                visibleMinPrice = Math.min(...visibleData.map(d => d.low));
-                visibleMaxPrice = Math.max(...visibleData.map(d => d.high));
-                // Add some padding
-                const padding = (visibleMaxPrice - visibleMinPrice) * 0.05;
-                visibleMinPrice -= padding;
-                visibleMaxPrice += padding;
-            }}
-            const visiblePriceRange = visibleMaxPrice - visibleMinPrice;
+                // X positions and price scale for the visible range, computed once per draw
+                // (scales are folded into per-frame constants so the loops only
+                // multiply and add)
+                const xStep = visible.count <= 1 ? 0 : chartWidth / (visible.count - 1);
+                const xs = new Float64Array(visible.count);
+                for (let k = 0; k < visible.count; k++) {{
+                    xs[k] = chartX + k * xStep;
+                }}
+                const yBase = chartY + chartHeight;
+                const yScale = chartHeight / visiblePriceRange;
+                const view = {{
+                    start: visible.start,
+                    end: visible.end,
+                    count: visible.count,
+                    xs: xs,
+                    minPrice: visibleMinPrice,
+                    priceRange: visiblePriceRange,
+                    candleWidth: Math.max(2, (chartWidth / visible.count) * 0.8),
+                    yBase: yBase,
+                    yScale: yScale,
+                    priceToY: (price) => yBase - (price - visibleMinPrice) * yScale
+                }};
+
+                // Draw axes with visible price range
+                drawAxesWithRange(view);
             
-            // Override priceToY for visible range
-            const originalPriceToY = priceToY;
-            window.currentPriceToY = function(price) {{
-                return chartY + chartHeight - ((price - visibleMinPrice) / visiblePriceRange) * chartHeight;
-            }};
+                // Draw indicators first (behind candles) - for visible range
+                const paths = indicatorPaths(view);
+                drawBollingerBands(paths);
+                drawVWAP(paths);
+                drawMA10(paths);
+
+                // Draw candles for visible range. Candles closer together than
+                // MIN_CANDLE_SPACING pixels are merged so the number of drawn
+                // bars is bounded by the chart width, not the data length.
+                const candles = [];
+                const batch = newCandleBatch();
+                const bucketSize = Math.max(1, Math.ceil(visible.count * MIN_CANDLE_SPACING / chartWidth));
+                if (bucketSize === 1) {{
+                    for (let i = visible.start; i < visible.end; i++) {{
+                        const x = xs[i - visible.start];
+                        const depth = volumeToDepth(data.volume[i]);
+                        const candleRect = addCandleToBatch(batch, data, i, i, x, depth, view.candleWidth, view);
+                        if (candleRect) {{
+                            candles.push(candleRect);
+                        }}
+                    }}
+                }} else {{
+                    const bars = decimateCandles(visible, bucketSize);
+                    const barWidth = Math.max(2, (chartWidth / bars.index.length) * 0.8);
+                    for (let b = 0; b < bars.index.length; b++) {{
+                        const x = xs[bars.index[b] - visible.start];
+                        const depth = volumeToDepth(bars.volume[b]);
+                        const candleRect = addCandleToBatch(batch, bars, b, bars.index[b], x, depth, barWidth, view);
+                        if (candleRect) {{
+                            candles.push(candleRect);
+                        }}
+                    }}
+                }}
+                drawCandleBatch(batch);
+            
+                // Draw prediction markers
+                drawPredictionMarkers(view);
 
-            console.log('Drawing chart with', visible.count, 'visible candles (zoom:', zoomLevel.toFixed(2) + ')');
-            console.log('Visible range:', visible.start, 'to', visible.end);
-            console.log('Price range:', visibleMinPrice.toFixed(2), 'to', visibleMaxPrice.toFixed(2));
+                return candles;
+            }}
 
-            // Draw axes with visible price range
-            drawAxesWithRange(visibleMinPrice, visibleMaxPrice, visiblePriceRange);
-            
-            // Draw indicators first (behind candles) - for visible range
-            drawBollingerBandsForRange(visible.start, visible.end, visibleMinPrice, visibleMaxPrice, visiblePriceRange);
-            drawVWAPForRange(visible.start, visible.end, visibleMinPrice, visibleMaxPrice, visiblePriceRange);
-            drawMA10ForRange(visible.start, visible.end, visibleMinPrice, visibleMaxPrice, visiblePriceRange);
-
-            // Draw candles for visible range
-            const candles = [];
-            let drawnCount = 0;
-            for (let i = visible.start; i < visible.end; i++) {{
-                const x = indexToX(i);
-                const depth = volumeToDepth(data[i].volume);
-                const candleRect = drawCandleForRange(i, data[i], x, depth, visibleMinPrice, visibleMaxPrice, visiblePriceRange);
-                if (candleRect) {{
-                    candles.push(candleRect);
-                    drawnCount++;
+            // Renderer side of the page protocol
+            scope.onmessage = (e) => {{
+                const message = e.data;
+                if (message.type === 'init') {{
+                    canvas = message.canvas;
+                    ctx = canvas.getContext('2d');
+                    data = message.data;
+                    indicators = message.indicators;
+                    predictions = message.predictions;
+                    minPrice = message.minPrice;
+                    maxPrice = message.maxPrice;
+                    maxVolume = message.maxVolume;
+                    dataLength = message.dataLength;
+                }} else if (message.type === 'frame') {{
+                    if (canvas.width !== message.width || canvas.height !== message.height) {{
+                        canvas.width = message.width;
+                        canvas.height = message.height;
+                    }}
+                    const candles = drawChart(message.visible);
+                    scope.postMessage({{
+                        candles: candles,
+                        layout: {{ x: chartX, y: chartY, width: chartWidth, height: chartHeight }}
+                    }});
+                }}
+            }};
+        }}
+
+        // Start the renderer, in a worker when the browser supports it
+        function startRenderer(onFrame) {{
+            const init = {{
+                type: 'init',
+                data: data,
+                indicators: indicators,
+                predictions: predictions,
+                minPrice: minPrice,
+                maxPrice: maxPrice,
+                maxVolume: maxVolume,
+                dataLength: dataLength
+            }};
+            if (canvas.transferControlToOffscreen && typeof Worker !== 'undefined') {{
+                try {{
+                    const source = '(' + chartRenderer.toString() + ')(self);';
+                    const worker = new Worker(URL.createObjectURL(new Blob([source], {{ type: 'text/javascript' }})));
+                    worker.onmessage = (e) => onFrame(e.data);
+                    const offscreen = canvas.transferControlToOffscreen();
+                    init.canvas = offscreen;
+                    worker.postMessage(init, [offscreen]);
+                    return worker;
+                }} catch (err) {{
+                    console.warn('Worker rendering unavailable, drawing on the page:', err);
                 }}
             }}
-            
-            // Draw prediction markers
-            drawPredictionMarkers(visible.start, visible.end, visibleMinPrice, visibleMaxPrice, visiblePriceRange);
-            
-            console.log('Drawn', drawnCount, 'out of', visible.count, 'visible candles');
+            const port = {{ postMessage: (message) => onFrame(message) }};
+            chartRenderer(port);
+            init.canvas = canvas;
+            port.onmessage({{ data: init }});
+            return {{ postMessage: (message) => port.onmessage({{ data: message }}) }};
+        }}
 
+        // Chart layout of the last drawn frame (used for mouse mapping)
+        let chartWidth, chartHeight, chartX, chartY;
+        // Widest candle rect of the last frame (bounds the hover search)
+        let candleMaxWidth = 0;
+        let canvasWidth = 0;
+        let canvasHeight = 0;
+
+        const renderer = startRenderer((frame) => {{
+            chartX = frame.layout.x;
+            chartY = frame.layout.y;
+            chartWidth = frame.layout.width;
+            chartHeight = frame.layout.height;
             // Store candles for hover detection
-            window.chartCandles = candles;
+            window.chartCandles = frame.candles;
+            candleMaxWidth = 0;
+            for (let i = 0; i < frame.candles.length; i++) {{
+                candleMaxWidth = Math.max(candleMaxWidth, frame.candles[i].width);
+            }}
             if (window.hoveredCandleIndex === undefined) {{
                 window.hoveredCandleIndex = null;
             }}
+            drawOverlay();
+        }});
+
+        // Draw the vertical line through the hovered candle on the overlay
+        // (hover changes never redraw the chart itself)
+        function drawOverlay() {{
+            overlayCtx.clearRect(0, 0, overlay.width, overlay.height);
+            const index = window.hoveredCandleIndex;
+            const candle = index === null || index === undefined ? null : window.chartCandles[index];
+            if (!candle) return;
+            const x = candle.x + candle.width / 2;
+            overlayCtx.strokeStyle = '#FFD700';
+            overlayCtx.lineWidth = 2;
+            overlayCtx.setLineDash([5, 5]);
+            overlayCtx.beginPath();
+            overlayCtx.moveTo(x, chartY);
+            overlayCtx.lineTo(x, chartY + chartHeight);
+            overlayCtx.stroke();
+            overlayCtx.setLineDash([]);
+        }}
+
+        // Set canvas size
+        function resizeCanvas() {{
+            const container = canvas.parentElement;
+            if (!container) {{
+                console.error('Container not found');
+                return;
+            }}
+            canvasWidth = container.clientWidth || container.offsetWidth || 1200;
+            canvasHeight = container.clientHeight || container.offsetHeight || 700;
+            overlay.width = canvasWidth;
+            overlay.height = canvasHeight;
+            console.log('Canvas resized to:', canvasWidth, 'x', canvasHeight);
+            redrawChart();
+        }}
+
+        window.addEventListener('resize', resizeCanvas);
+        
+        // Wait for DOM to be ready
+        if (document.readyState === 'loading') {{
+            document.addEventListener('DOMContentLoaded', () => {{
+                setTimeout(resizeCanvas, 100);
+            }});
+        }} else {{
+            setTimeout(resizeCanvas, 100);
         }}
 
         // Zoom state
@@ -1276,23 +1391,66 @@ html_content = f"""<!DOCTYPE html>
 
         // Redraw chart with zoom and pan
         function redrawChart() {{
-            drawChart();
-            
-            // Draw vertical line if hovering
-            if (window.hoveredCandleIndex !== null && window.hoveredCandleIndex !== undefined) {{
-                const candle = window.chartCandles[window.hoveredCandleIndex];
-                if (candle) {{
-                    const x = candle.x + candle.width / 2;
-                    ctx.strokeStyle = '#FFD700';
-                    ctx.lineWidth = 2;
-                    ctx.setLineDash([5, 5]);
-                    ctx.beginPath();
-                    ctx.moveTo(x, chartY);
-                    ctx.lineTo(x, chartY + chartHeight);
-                    ctx.stroke();
-                    ctx.setLineDash([]);
+            if (canvasWidth === 0 || canvasHeight === 0) {{
+                console.warn('Canvas has zero dimensions, retrying...');
+                setTimeout(resizeCanvas, 100);
+                return;
+            }}
+            renderer.postMessage({{
+                type: 'frame',
+                width: canvasWidth,
+                height: canvasHeight,
+                visible: getVisibleRange()
+            }});
+        }}
+
+        // Find the first candle whose hover box (its rect widened by 10px on
+        // each side) contains the point. Candles are sorted by x, so a binary
+        // search skips every candle starting too far left to reach x.
+        function candleIndexAt(x, y) {{
+            const candles = window.chartCandles;
+            const minX = x - candleMaxWidth - 10;
+            let lo = 0;
+            let hi = candles.length;
+            while (lo < hi) {{
+                const mid = (lo + hi) >> 1;
+                if (candles[mid].x > minX) hi = mid; else lo = mid + 1;
+            }}
+            for (let i = lo; i < candles.length && candles[i].x < x + 10; i++) {{
+                const candle = candles[i];
+                const candleCenterX = candle.x + candle.width / 2;
+                const distanceX = Math.abs(x - candleCenterX);
+                
+                if (distanceX < candle.width / 2 + 10 && 
+                    y >= candle.y && y <= candle.y + candle.height) {{
+                    return i;
                 }}
             }}
+            return null;
+        }}
+
+        // Mouse events fire many times per display frame; pan/zoom redraws and
+        // hover-line updates are coalesced into one animation frame callback
+        let framePending = false;
+        let chartDirty = false;
+
+        function requestFrame() {{
+            if (framePending) return;
+            framePending = true;
+            requestAnimationFrame(() => {{
+                framePending = false;
+                if (chartDirty) {{
+                    chartDirty = false;
+                    redrawChart(); // the frame callback redraws the overlay too
+                }} else {{
+                    drawOverlay();
+                }}
+            }});
+        }}
+
+        function scheduleRedraw() {{
+            chartDirty = true;
+            requestFrame();
         }}
 
 
@@ -1308,7 +1466,7 @@ html_content = f"""<!DOCTYPE html>
             window.hoveredCandleIndex = null;
             isPanning = false;
             canvas.style.cursor = 'crosshair';
-            redrawChart();
+            drawOverlay();
         }});
 
         // Panning functionality - click and drag to move around
@@ -1342,7 +1500,7 @@ html_content = f"""<!DOCTYPE html>
                 if (newStart >= 0 && newEnd <= dataLength && newEnd - newStart === visible.count) {{
                     visibleStart = newStart;
                     visibleEnd = newEnd;
-                    redrawChart();
+                    scheduleRedraw();
                 }}
                 
                 return; // Don't process hover when panning
@@ -1355,30 +1513,18 @@ html_content = f"""<!DOCTYPE html>
 
             if (!window.chartCandles) return;
 
-            let hoveredCandle = null;
-            let hoveredIndex = null;
-            for (let i = 0; i < window.chartCandles.length; i++) {{
-                const candle = window.chartCandles[i];
-                const candleCenterX = candle.x + candle.width / 2;
-                const distanceX = Math.abs(x - candleCenterX);
-                
-                if (distanceX < candle.width / 2 + 10 && 
-                    y >= candle.y && y <= candle.y + candle.height) {{
-                    hoveredCandle = candle;
-                    hoveredIndex = i;
-                    break;
-                }}
-            }}
+            const hoveredIndex = candleIndexAt(x, y);
+            const hoveredCandle = hoveredIndex === null ? null : window.chartCandles[hoveredIndex];
 
             window.hoveredCandleIndex = hoveredIndex;
 
             if (hoveredCandle) {{
-                const c = hoveredCandle.candle;
-                const date = new Date(c.date + 'T00:00:00');
-                const dateStr = date.toLocaleDateString('en-US', {{ 
+                const c = candleAt(hoveredCandle.index);
+                const dateStr = c.date.toLocaleDateString('en-US', {{ 
                     year: 'numeric', 
                     month: 'long', 
-                    day: 'numeric' 
+                    day: 'numeric',
+                    timeZone: 'UTC'
                 }});
 
                 tooltip.innerHTML = `
@@ -1420,12 +1566,12 @@ html_content = f"""<!DOCTYPE html>
                 tooltip.style.left = tooltipX + 'px';
                 tooltip.style.top = tooltipY + 'px';
                 
-                // Redraw to show vertical line
-                redrawChart();
+                // Move the vertical line
+                requestFrame();
             }} else {{
                 tooltip.classList.remove('show');
                 window.hoveredCandleIndex = null;
-                redrawChart();
+                requestFrame();
             }}
         }});
 
@@ -1440,7 +1586,7 @@ html_content = f"""<!DOCTYPE html>
                 const targetIndex = mouseXToIndex(mouseX);
                 const delta = e.deltaY > 0 ? 0.9 : 1.1;
                 zoomToIndex(targetIndex, delta);
-                redrawChart();
+                scheduleRedraw();
             }}
         }});
 
@@ -1494,11 +1640,31 @@ html_content = f"""<!DOCTYPE html>
 </html>
 """
 
-# Write HTML file
-with open("candlestick_chart.html", "w", encoding="utf-8") as f:
-    f.write(html_content)
-
-print("[OK] Chart generated successfully!")
-print(f"[OK] File: candlestick_chart.html")
-print(f"[OK] Data points: {len(chart_data)}")
-print(f"\nOpen 'candlestick_chart.html' in your browser to view the chart.")
+    # Write HTML file; cached JSON blocks are copied in as they are
+    def embed(f, name, obj):
+        if cache_dir is not None:
+            with open(cache_dir / name, 'rb') as cached:
+                shutil.copyfileobj(cached, f)
+        else:
+            write_json(f, obj)
+
+    with open(output_file, "wb") as f:
+        f.write(html_head.encode('utf-8'))
+        embed(f, 'candles.json', chart_data)
+        f.write(html_middle.encode('utf-8'))
+        embed(f, 'predictions.json', predictions)
+        f.write(html_tail.encode('utf-8'))
+
+    print("[OK] Chart generated successfully!")
+    print(f"[OK] File: {output_file}")
+    print(f"[OK] Data points: {num_candles}")
+    print(f"\nOpen '{output_file}' in your browser to view the chart.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate HTML candlestick chart from stock data")
+    parser.add_argument('data_file', nargs='?', default=DATA_FILE, help="CSV or Excel file with OHLCV data")
+    parser.add_argument('-o', '--output', default="candlestick_chart.html", help="Output HTML file")
+    parser.add_argument('--no-cache', action='store_true', help="Recompute the chart data even if it is cached")
+    args = parser.parse_args()
+    main(args.data_file, args.output, use_cache=not args.no_cache)
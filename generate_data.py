@@ -1,95 +1,287 @@
 """
-Generate JSON data file for frontend
+Generate JSON (and Arrow) data files for frontend
 """
 
 from data_loader import load_stock
-from calculation import calculate_ma_dict, calculate_bollinger_bands_dict, calculate_vwap_dict
+from calculation import calculate_ma, calculate_bollinger_bands, calculate_vwap
 from price_predictor import get_market_direction_predictions
+import argparse
+from collections import Counter
+import hashlib
 import json
+import numpy as np
 import pandas as pd
 import os
+from typing import List, Dict, Optional
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
 
 # Local file path
 DATA_FILE = r"C:\Users\veenu\Downloads\ongc24-25.csv"
 
-print("Loading data...")
-df = load_stock(DATA_FILE)
-print(f"Loaded {len(df)} rows")
+# Output file served by the React frontend
+OUTPUT_PATH = os.path.join('frontend', 'public', 'data.json')
+
+# Indicator parameters
+MA_PERIOD = 10
+BB_PERIOD = 20
+BB_NUM_STD = 2.0
+
+# Bump when the output format or calculations change so existing outputs are rebuilt
+DATA_CACHE_VERSION = 1
+
+
+def _optional_floats(values: np.ndarray) -> List[Optional[float]]:
+    """
+    Convert an indicator array to plain floats with NaN as None (null in JSON)
+    
+    Args:
+        values: 1-D float array
+    
+    Returns:
+        List with one float or None per value
+    """
+    # NaN is the only float not equal to itself
+    return [None if v != v else v for v in values.tolist()]
+
+
+def write_arrow(
+    df: pd.DataFrame,
+    dates: List[str],
+    series: Dict[str, np.ndarray],
+    predictions: List[Dict],
+    metadata: Dict[str, float],
+    arrow_path: str
+) -> None:
+    """
+    Write the chart data as an Arrow IPC file, one column per series.
+    
+    Prices and indicators are float32 (NaN where missing), volume float64,
+    dates and prediction labels strings. The columns are taken straight from
+    the DataFrame and the indicator arrays, and the scalar chart values go
+    into the schema metadata, so the frontend gets typed arrays without
+    parsing one object per candle.
+    
+    Args:
+        df: Stock data as returned by load_stock
+        dates: Formatted date of each row
+        series: Indicator arrays by column name (e.g. 'ma10', 'bb_upper')
+        predictions: Prediction dicts; written only when there is one per row
+        metadata: Scalar chart values (minPrice, maxPrice, priceRange, maxVolume)
+        arrow_path: Path of the .arrow file to write
+    """
+    columns = {
+        'date': pa.array(dates, type=pa.string()),
+        'open': df['open'].to_numpy(dtype=np.float32),
+        'high': df['high'].to_numpy(dtype=np.float32),
+        'low': df['low'].to_numpy(dtype=np.float32),
+        'close': df['close'].to_numpy(dtype=np.float32),
+        'volume': df['volume'].fillna(0).to_numpy(dtype=np.float64)
+    }
+    for name, values in series.items():
+        columns[name] = values.astype(np.float32)
+    if len(predictions) == len(df):
+        columns['prediction'] = pa.array(
+            [p.get('prediction') if p else None for p in predictions], type=pa.string()
+        )
+    
+    table = pa.table(columns, metadata={key: str(value) for key, value in metadata.items()})
+    with pa.OSFile(arrow_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def output_cache_key(data_file: str) -> Optional[str]:
+    """
+    Key identifying the outputs for a data file, from its modification time and size.
+    
+    Args:
+        data_file: CSV or Excel file with OHLCV data
+    
+    Returns:
+        Hex digest of the file's path, mtime and size plus the indicator
+        parameters, or None if the file cannot be stat'ed
+    """
+    try:
+        stat = os.stat(data_file)
+    except OSError:
+        return None
+    key = (
+        f"v{DATA_CACHE_VERSION}|{os.path.abspath(data_file)}|{stat.st_mtime_ns}|{stat.st_size}"
+        f"|ma={MA_PERIOD}|bb={BB_PERIOD},{BB_NUM_STD}|vwap|arrow={_HAS_PYARROW}"
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
 
-# Prepare data for chart
-chart_data = []
-for _, row in df.iterrows():
-    volume = row['volume']
-    if pd.isna(volume):
-        volume = 0
+def main(
+    data_file: str = DATA_FILE,
+    output_path: str = OUTPUT_PATH,
+    arrow_path: Optional[str] = None,
+    use_cache: bool = True
+):
+    """
+    Load stock data, calculate indicators and write the frontend data files.
+    
+    data.json is always written; with pyarrow installed the same data is also
+    written as an Arrow IPC file, which the frontend loads first.
+    
+    The key of the data file the outputs were built from is kept in a sidecar
+    file (<output_path>.cache); when it still matches, nothing is rebuilt.
     
-    chart_data.append({
-        'date': row['date'].strftime('%Y-%m-%d'),
-        'open': float(row['open']),
-        'high': float(row['high']),
-        'low': float(row['low']),
-        'close': float(row['close']),
-        'volume': float(volume)
-    })
-
-# Calculate chart dimensions
-min_price = float(df['low'].min())
-max_price = float(df['high'].max())
-price_range = max_price - min_price
-max_volume = float(df['volume'].max())
-if pd.isna(max_volume) or max_volume == 0:
-    max_volume = 1.0
-
-# Calculate technical indicators
-print("Calculating technical indicators...")
-ma_10 = calculate_ma_dict(df, period=10)
-bollinger_bands = calculate_bollinger_bands_dict(df, period=20, num_std=2.0)
-vwap = calculate_vwap_dict(df)
-
-print("[OK] Calculated 10-day MA")
-print("[OK] Calculated Bollinger Bands")
-print("[OK] Calculated VWAP")
-
-# Calculate price predictions using market direction logic
-print("Generating predictions...")
-print("Note: Market direction logic to be implemented by user")
-
-predictions = get_market_direction_predictions(df)
-print(f"[OK] Generated {len(predictions)} predictions")
-if predictions:
-    rise_count = sum(1 for p in predictions if p and p.get('prediction') == 'rise')
-    fall_count = sum(1 for p in predictions if p and p.get('prediction') == 'fall')
-    print(f"  Predictions: {rise_count} rise, {fall_count} fall")
-
-# Create output data structure
-output_data = {
-    'chartData': chart_data,
-    'minPrice': min_price,
-    'maxPrice': max_price,
-    'priceRange': price_range,
-    'maxVolume': max_volume,
-    'indicators': {
-        'ma10': ma_10,
-        'bollingerBands': bollinger_bands,
-        'vwap': vwap
-    },
-    'predictions': predictions
-}
-
-# Write to frontend public directory
-output_path = os.path.join('frontend', 'public', 'data.json')
-os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-with open(output_path, 'w', encoding='utf-8') as f:
-    json.dump(output_data, f, indent=2)
-
-print(f"[OK] Data generated successfully!")
-print(f"[OK] File: {output_path}")
-print(f"[OK] Data points: {len(chart_data)}")
-print(f"[OK] Price range: Rs {min_price:.2f} - Rs {max_price:.2f}")
-print(f"\nNext steps:")
-print(f"1. cd frontend")
-print(f"2. npm install")
-print(f"3. npm run dev")
+    Args:
+        data_file: CSV or Excel file with OHLCV data
+        output_path: JSON output file
+        arrow_path: Arrow output file (default: output_path with an .arrow extension)
+        use_cache: If False, always rebuild the outputs
+    """
+    arrow_path = arrow_path or os.path.splitext(output_path)[0] + '.arrow'
+    outputs = [output_path, arrow_path] if _HAS_PYARROW else [output_path]
+    key_path = output_path + '.cache'
+    key = output_cache_key(data_file) if use_cache else None
+    if key and all(os.path.exists(path) for path in outputs) and os.path.exists(key_path):
+        with open(key_path, encoding='utf-8') as f:
+            if f.read().strip() == key:
+                print(f"[OK] {output_path} is up to date ({data_file} unchanged)")
+                return
+
+    print("Loading data...")
+    df = load_stock(data_file, use_pyarrow=True)
+    print(f"Loaded {len(df)} rows")
+
+    # Prepare data for chart: convert whole columns, then zip them into records
+    dates = df['date'].dt.strftime('%Y-%m-%d').tolist()
+    opens = df['open'].astype(float).tolist()
+    highs = df['high'].astype(float).tolist()
+    lows = df['low'].astype(float).tolist()
+    closes = df['close'].astype(float).tolist()
+    volumes = df['volume'].fillna(0).astype(float).tolist()
+    chart_data = [
+        {'date': d, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+        for d, o, h, l, c, v in zip(dates, opens, highs, lows, closes, volumes)
+    ]
+
+    # Calculate chart dimensions
+    min_price = float(df['low'].min())
+    max_price = float(df['high'].max())
+    price_range = max_price - min_price
+    max_volume = float(df['volume'].max())
+    if pd.isna(max_volume) or max_volume == 0:
+        max_volume = 1.0
+
+    # Calculate technical indicators
+    print("Calculating technical indicators...")
+    # Arrays feed the Arrow columns directly; the JSON entries are built from them
+    ma_values = calculate_ma(df, period=MA_PERIOD, as_array=True)
+    bands = calculate_bollinger_bands(df, period=BB_PERIOD, num_std=BB_NUM_STD, as_array=True)
+    vwap_values = calculate_vwap(df, as_array=True)
+    ma_10 = [{'date': d, 'ma': v} for d, v in zip(dates, _optional_floats(ma_values))]
+    bollinger_bands = [
+        {'date': d, 'upper': u, 'middle': m, 'lower': l}
+        for d, u, m, l in zip(
+            dates,
+            _optional_floats(bands['upper']),
+            _optional_floats(bands['middle']),
+            _optional_floats(bands['lower'])
+        )
+    ]
+    vwap = [{'date': d, 'vwap': v} for d, v in zip(dates, _optional_floats(vwap_values))]
+
+    print("[OK] Calculated 10-day MA")
+    print("[OK] Calculated Bollinger Bands")
+    print("[OK] Calculated VWAP")
+
+    # Calculate price predictions using market direction logic
+    print("Generating predictions...")
+    print("Note: Market direction logic to be implemented by user")
+
+    predictions = get_market_direction_predictions(df)
+    print(f"[OK] Generated {len(predictions)} predictions")
+    if predictions:
+        counts = Counter(p.get('prediction') for p in predictions if p)
+        print(f"  Predictions: {counts['rise']} rise, {counts['fall']} fall")
+
+    # Create output data structure
+    output_data = {
+        'chartData': chart_data,
+        'minPrice': min_price,
+        'maxPrice': max_price,
+        'priceRange': price_range,
+        'maxVolume': max_volume,
+        'indicators': {
+            'ma10': ma_10,
+            'bollingerBands': bollinger_bands,
+            'vwap': vwap
+        },
+        'predictions': predictions
+    }
+
+    # Write to frontend public directory
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    # Drop the old key first so interrupted writes are never reused
+    if os.path.exists(key_path):
+        os.remove(key_path)
+
+    # Compact JSON (no indentation) keeps the file small for the frontend fetch
+    if _HAS_ORJSON:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, separators=(',', ':'))
+
+    if _HAS_PYARROW:
+        series = {
+            'ma10': ma_values,
+            'bb_upper': bands['upper'],
+            'bb_middle': bands['middle'],
+            'bb_lower': bands['lower'],
+            'vwap': vwap_values
+        }
+        metadata = {
+            'minPrice': min_price,
+            'maxPrice': max_price,
+            'priceRange': price_range,
+            'maxVolume': max_volume
+        }
+        write_arrow(df, dates, series, predictions, metadata, arrow_path)
+    elif os.path.exists(arrow_path):
+        # Don't leave an Arrow file from an earlier run that no longer matches data.json
+        os.remove(arrow_path)
+
+    if key:
+        with open(key_path, 'w', encoding='utf-8') as f:
+            f.write(key)
+
+    print(f"[OK] Data generated successfully!")
+    print(f"[OK] File: {output_path}")
+    if _HAS_PYARROW:
+        print(f"[OK] Arrow file: {arrow_path}")
+    print(f"[OK] Data points: {len(chart_data)}")
+    print(f"[OK] Price range: Rs {min_price:.2f} - Rs {max_price:.2f}")
+    print(f"\nNext steps:")
+    print(f"1. cd frontend")
+    print(f"2. npm install")
+    print(f"3. npm run dev")
 
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate JSON data file for frontend")
+    parser.add_argument('data_file', nargs='?', default=DATA_FILE, help="CSV or Excel file with OHLCV data")
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH, help="Output JSON file")
+    parser.add_argument('--no-cache', action='store_true', help="Rebuild even if the data file is unchanged")
+    args = parser.parse_args()
+    main(args.data_file, args.output, use_cache=not args.no_cache)
@@ -2,27 +2,33 @@
 Main entry point for The Interest Game
 """
 
+import argparse
+
 from data_loader import load_stock
-from market_direction import MarketDirectionDetector, determine_market_direction
+from market_direction import determine_market_direction
 
 # Local file path for data
 DATA_FILE = r"C:\Users\veenu\Downloads\ongc24-25.csv"
 
 
-def main():
+def main(data_file: str = DATA_FILE):
     """Analyze stock data and determine market direction."""
-    # Load stock data
-    df = load_stock(DATA_FILE)
+    # Load stock data (CSV parsed by the multi-threaded pyarrow engine when installed)
+    df = load_stock(data_file, use_pyarrow=True)
     
     # Determine market direction
     direction = determine_market_direction(df)
     
     print(f"Market Direction: {direction.upper()}")
     print(f"Data points: {len(df)} days")
-    print(f"Date range: {df['date'].min().date()} to {df['date'].max().date()}")
+    # load_stock returns rows sorted by date
+    print(f"Date range: {df['date'].iloc[0].date()} to {df['date'].iloc[-1].date()}")
     print(f"Current price: ₹{df['close'].iloc[-1]:.2f}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Determine market direction for a stock data file")
+    parser.add_argument('data_file', nargs='?', default=DATA_FILE, help="CSV or Excel file with OHLCV data")
+    args = parser.parse_args()
+    main(args.data_file)
 
@@ -6,7 +6,6 @@ Determines if a stock is in an increasing, decreasing, sideways, or no-trade mar
 import pandas as pd
 import numpy as np
 from typing import Literal, Optional
-from datetime import datetime, timedelta
 
 
 class MarketDirectionDetector:
@@ -38,6 +37,25 @@ class MarketDirectionDetector:
             return 0.0
         return ((close_price - open_price) / open_price) * 100
     
+    def calculate_body_percentages(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Calculate the body percentage for every row at once.
+        
+        Vectorized form of calculate_body_percentage over the open/close columns.
+        
+        Args:
+            df: DataFrame with 'open' and 'close' columns
+        
+        Returns:
+            Array of percentage changes from open to close (0.0 where open is 0)
+        """
+        opens = df['open'].to_numpy(dtype=np.float64)
+        closes = df['close'].to_numpy(dtype=np.float64)
+        
+        body_percentages = np.zeros(len(opens), dtype=np.float64)
+        np.divide(closes - opens, opens, out=body_percentages, where=opens != 0)
+        return body_percentages * 100
+    
     def check_trending_market(self, df: pd.DataFrame) -> Optional[Literal['increasing', 'decreasing']]:
         """
         Case 1: Check if stock is trending (increasing or decreasing).
@@ -101,12 +119,7 @@ class MarketDirectionDetector:
             return False
         
         # Calculate body percentage for each day
-        body_percentages = []
-        for _, row in df.iterrows():
-            body_pct = abs(self.calculate_body_percentage(row['open'], row['close']))
-            body_percentages.append(body_pct)
-        
-        body_percentages = np.array(body_percentages)
+        body_percentages = np.abs(self.calculate_body_percentages(df))
         
         # Check for 7+ days with body in 0-1.5% range
         condition_1 = body_percentages <= 1.5
@@ -122,6 +135,23 @@ class MarketDirectionDetector:
         
         return False
     
+    def _sort_by_date(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return df ordered by date with a fresh positional index.
+        
+        Skips the sort when the dates are already ascending, which is the
+        case for data returned by data_loader.
+        
+        Args:
+            df: DataFrame with a 'date' column
+        
+        Returns:
+            DataFrame sorted by date (ascending)
+        """
+        if not df['date'].is_monotonic_increasing:
+            df = df.sort_values('date')
+        return df.reset_index(drop=True)
+    
     def _find_max_consecutive(self, condition_array: np.ndarray) -> int:
         """
         Find maximum consecutive True values in a boolean array.
@@ -135,17 +165,14 @@ class MarketDirectionDetector:
         if len(condition_array) == 0:
             return 0
         
-        max_consecutive = 0
-        current_consecutive = 0
-        
-        for value in condition_array:
-            if value:
-                current_consecutive += 1
-                max_consecutive = max(max_consecutive, current_consecutive)
-            else:
-                current_consecutive = 0
+        # Pad with False so every run of True has a start and an end edge
+        padded = np.concatenate(([False], np.asarray(condition_array, dtype=bool), [False]))
+        edges = np.flatnonzero(padded[1:] != padded[:-1])
+        if len(edges) == 0:
+            return 0
         
-        return max_consecutive
+        # Edges alternate start, end, start, end, ...
+        return int((edges[1::2] - edges[::2]).max())
     
     def determine_direction(
         self, 
@@ -169,7 +196,7 @@ class MarketDirectionDetector:
             'increasing', 'decreasing', 'sideways', or 'no_trade'
         """
         # Ensure data is sorted by date
-        df = df.sort_values('date').reset_index(drop=True)
+        df = self._sort_by_date(df)
         
         # Use only recent data if lookback_days is specified
         if lookback_days is not None and len(df) > lookback_days:
@@ -205,7 +232,7 @@ class MarketDirectionDetector:
             Dictionary with direction and optional details
         """
         # Ensure data is sorted
-        df = df.sort_values('date').reset_index(drop=True)
+        df = self._sort_by_date(df)
         
         # Use only recent data if specified
         analysis_df = df.copy()
@@ -217,7 +244,7 @@ class MarketDirectionDetector:
         
         result = {
             'direction': direction,
-            'analysis_date': df['date'].max() if len(df) > 0 else None,
+            'analysis_date': df['date'].iloc[-1] if len(df) > 0 else None,
             'total_days_analyzed': len(analysis_df)
         }
         
@@ -235,10 +262,7 @@ class MarketDirectionDetector:
             }
             
             # Calculate body percentages for recent days
-            recent_body_pct = []
-            for _, row in analysis_df.tail(20).iterrows():
-                body_pct = self.calculate_body_percentage(row['open'], row['close'])
-                recent_body_pct.append(abs(body_pct))
+            recent_body_pct = np.abs(self.calculate_body_percentages(analysis_df.tail(20))).tolist()
             result['details']['recent_body_percentages'] = recent_body_pct[-10:] if len(recent_body_pct) > 10 else recent_body_pct
         
         return result
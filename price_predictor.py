@@ -6,6 +6,8 @@ Placeholder for market direction predictions - logic to be implemented by user
 import pandas as pd
 from typing import List, Dict
 
+from calculation._dates import format_dates
+
 
 def get_market_direction_predictions(df: pd.DataFrame, lookback_window: int = 20) -> List[Dict]:
     """
@@ -35,10 +37,7 @@ def get_market_direction_predictions(df: pd.DataFrame, lookback_window: int = 20
     # TODO: Implement your market direction logic here
     # For now, returning empty predictions
     
-    for i in range(len(df)):
-        candle_date = df.iloc[i]['date']
-        date_str = candle_date.strftime('%Y-%m-%d') if hasattr(candle_date, 'strftime') else str(candle_date)
-        
+    for date_str in format_dates(df['date']):
         predictions.append({
             'date': date_str,
             'prediction': None,
@@ -6,7 +6,6 @@ Execute this single file to run the entire system
 import os
 import sys
 import subprocess
-import time
 from pathlib import Path
 
 # Colors for terminal output
@@ -0,0 +1,155 @@
+"""
+Parity tests for the technical indicator calculations
+
+Each indicator has a single-pass kernel (compiled when numba is installed,
+plain Python otherwise) and a NumPy fallback; both are checked against the
+pandas formulas they replaced.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from calculation import calculate_bb_batch, calculate_bollinger_bands, calculate_ma, calculate_ma_and_bb, calculate_vwap
+from calculation import bollinger_bands, moving_average, vwap
+
+
+def price_series(n: int = 300, seed: int = 7) -> np.ndarray:
+    """Random-walk closes around 250 with leading NaNs and interior NaN gaps"""
+    rng = np.random.default_rng(seed)
+    values = 250.0 + np.cumsum(rng.normal(0.0, 2.0, n))
+    values[:3] = np.nan
+    values[n // 7:n // 7 + 5] = np.nan
+    values[rng.choice(np.arange(n // 5, n), size=n // 20, replace=False)] = np.nan
+    return values
+
+
+def use_kernel(monkeypatch, module, enabled: bool) -> None:
+    """Force a calculation module onto its kernel or its NumPy fallback path"""
+    monkeypatch.setattr(module, 'HAS_NUMBA', enabled)
+
+
+@pytest.mark.parametrize('kernel', [False, True], ids=['numpy', 'kernel'])
+@pytest.mark.parametrize('period', [1, 2, 10, 500])
+def test_ma_matches_pandas_rolling_mean(monkeypatch, kernel, period):
+    use_kernel(monkeypatch, moving_average, kernel)
+    close = pd.Series(price_series())
+    
+    ma = calculate_ma(pd.DataFrame({'close': close}), period=period, as_array=True)
+    
+    expected = close.rolling(window=period, min_periods=1).mean().to_numpy()
+    np.testing.assert_allclose(ma, expected, rtol=1e-12, equal_nan=True)
+
+
+@pytest.mark.parametrize('kernel', [False, True], ids=['numpy', 'kernel'])
+def test_ma_all_nan_window_is_nan(monkeypatch, kernel):
+    use_kernel(monkeypatch, moving_average, kernel)
+    data = pd.DataFrame({'close': [1.0, np.nan, np.nan, np.nan, 5.0]})
+    
+    ma = calculate_ma(data, period=2)
+    
+    assert ma[:2] == [1.0, 1.0]
+    assert np.isnan(ma[2]) and np.isnan(ma[3])
+    assert ma[4] == 5.0
+
+
+@pytest.mark.parametrize('kernel', [False, True], ids=['numpy', 'kernel'])
+@pytest.mark.parametrize('period', [1, 2, 20, 500])
+def test_bollinger_bands_match_pandas_rolling(monkeypatch, kernel, period):
+    use_kernel(monkeypatch, bollinger_bands, kernel)
+    close = pd.Series(price_series())
+    
+    bands = calculate_bollinger_bands(pd.DataFrame({'close': close}), period=period, num_std=2.0, as_array=True)
+    
+    rolling = close.rolling(window=period, min_periods=1)
+    mean = rolling.mean().to_numpy()
+    std = rolling.std().to_numpy()
+    # Running-sum variance loses a few digits to cancellation on short windows
+    tolerance = {'rtol': 1e-9, 'atol': 1e-6, 'equal_nan': True}
+    np.testing.assert_allclose(bands['middle'], mean, **tolerance)
+    np.testing.assert_allclose(bands['upper'], mean + 2.0 * std, **tolerance)
+    np.testing.assert_allclose(bands['lower'], mean - 2.0 * std, **tolerance)
+
+
+def baseline_vwap(data: pd.DataFrame) -> np.ndarray:
+    """Cumulative VWAP as originally computed with pandas cumsum"""
+    typical_price = (data['high'] + data['low'] + data['close']) / 3.0
+    volume = data['volume'].fillna(0)
+    result = (typical_price * volume).cumsum() / volume.cumsum().replace(0, np.nan)
+    result = result.fillna(typical_price)
+    result[np.isinf(result)] = typical_price[np.isinf(result)]
+    return result.to_numpy()
+
+
+@pytest.mark.parametrize('kernel', [False, True], ids=['numpy', 'kernel'])
+def test_vwap_matches_cumsum_formula(monkeypatch, kernel):
+    use_kernel(monkeypatch, vwap, kernel)
+    close = price_series(seed=11)
+    volume = np.random.default_rng(11).integers(1_000, 50_000, close.size).astype(float)
+    # Zero volume up front leaves the cumulative volume at 0, then NaN and zero gaps
+    volume[:4] = 0.0
+    volume[[10, 60, 61]] = np.nan
+    volume[[20, 90]] = 0.0
+    data = pd.DataFrame({'high': close + 1.5, 'low': close - 1.5, 'close': close, 'volume': volume})
+    
+    result = calculate_vwap(data, as_array=True)
+    
+    expected = baseline_vwap(data)
+    np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+    # Rows without any traded volume yet fall back to the typical price
+    typical_price = (data['high'] + data['low'] + data['close']).to_numpy() / 3.0
+    np.testing.assert_allclose(result[:4], typical_price[:4], equal_nan=True)
+
+
+@pytest.mark.parametrize('as_array', [False, True], ids=['list', 'array'])
+def test_ma_and_bb_shared_period_returns_independent_ma(as_array):
+    data = pd.DataFrame({'close': price_series(seed=3)})
+    
+    result = calculate_ma_and_bb(data, ma_period=20, bb_period=20, as_array=as_array)
+    
+    np.testing.assert_array_equal(result['ma'], result['middle'])
+    expected_middle = np.array(result['middle'], dtype=float)
+    result['ma'][5] = -1.0
+    np.testing.assert_array_equal(result['middle'], expected_middle)
+
+
+def test_ma_and_bb_separate_periods_match_single_calls():
+    data = pd.DataFrame({'close': price_series(seed=3)})
+    
+    result = calculate_ma_and_bb(data, ma_period=10, bb_period=20, as_array=True)
+    
+    np.testing.assert_array_equal(result['ma'], calculate_ma(data, 10, as_array=True))
+    bands = calculate_bollinger_bands(data, 20, as_array=True)
+    for key in ('upper', 'middle', 'lower'):
+        np.testing.assert_array_equal(result[key], bands[key])
+
+
+@pytest.mark.parametrize('kernel', [False, True], ids=['numpy', 'kernel'])
+def test_bb_batch_matches_single_series(monkeypatch, kernel):
+    use_kernel(monkeypatch, bollinger_bands, kernel)
+    arrays = [price_series(n, seed=n) for n in (300, 120, 25, 5)]
+    
+    results = calculate_bb_batch(arrays, period=20, num_std=2.0)
+    
+    assert len(results) == len(arrays)
+    for values, result in zip(arrays, results):
+        expected = calculate_bollinger_bands(pd.DataFrame({'close': values}), 20, 2.0, as_array=True)
+        for key in ('upper', 'middle', 'lower'):
+            assert result[key].shape == values.shape
+            np.testing.assert_allclose(result[key], expected[key], rtol=1e-12, equal_nan=True)
+
+
+def test_bb_batch_padding_rows_stay_nan():
+    short = price_series(30, seed=1)[3:]
+    values_2d = np.full((2, 60), np.nan)
+    values_2d[0] = price_series(60, seed=2)
+    values_2d[1, 60 - short.size:] = short
+    upper, middle, lower = (np.empty_like(values_2d) for _ in range(3))
+    
+    bollinger_bands._bb_batch(values_2d, 20, 2.0, upper, middle, lower)
+    
+    pad = 60 - short.size
+    assert np.isnan(middle[1, :pad]).all()
+    assert np.isnan(upper[1, :pad]).all() and np.isnan(lower[1, :pad]).all()
+    expected = calculate_bollinger_bands(pd.DataFrame({'close': short}), 20, 2.0, as_array=True)
+    np.testing.assert_allclose(middle[1, pad:], expected['middle'], rtol=1e-12, equal_nan=True)
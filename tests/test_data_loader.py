@@ -0,0 +1,191 @@
+"""
+Tests for the stock data loader
+"""
+
+import os
+import warnings
+
+import pandas as pd
+import pytest
+
+from data_loader import ExcelDataLoader, load_stock, _HAS_PYARROW
+
+STOCK_CSV = (
+    'Date ,Open,High,Low,Close,Prev Close,Volume\n'
+    '11-Nov-2024,262.35,262.35,256.00,257.10,262.55,"8,450,657"\n'
+    '12-Nov-2024,257.50,259.90,251.05,252.30,257.10,"12,130,001"\n'
+    '13-Nov-2024,252.00,253.40,246.15,247.45,252.30,"9,004,112"\n'
+)
+
+
+def write_csv(directory, name: str, text: str = STOCK_CSV) -> str:
+    """Write a CSV fixture into directory and return its file name"""
+    (directory / name).write_text(text)
+    return name
+
+
+def test_coerce_stock_columns_does_not_write_into_source(tmp_path):
+    raw = pd.DataFrame({
+        'Date': ['2024-01-01', '2024-01-02'],
+        'Open': ['10', '11'],
+        'High': ['12', '13'],
+        'Low': ['9', '10'],
+        'Close': ['11', '12'],
+        'Volume': ['1,000', '2,000'],
+    })
+    original = raw.copy()
+    loader = ExcelDataLoader(data_directory=str(tmp_path), use_cache=False)
+    
+    with warnings.catch_warnings():
+        # SettingWithCopyWarning on pandas without Copy-on-Write
+        warnings.simplefilter('error')
+        stock_df = loader._coerce_stock_columns(raw)
+    
+    stock_df.loc[0, 'close'] = -1.0
+    # Column names are normalized in place; the values must be untouched
+    assert raw.to_numpy().tolist() == original.to_numpy().tolist()
+    assert stock_df['volume'].tolist() == [1000.0, 2000.0]
+
+
+@pytest.mark.skipif(not _HAS_PYARROW, reason="Parquet cache requires pyarrow")
+class TestParquetCache:
+    def test_second_load_is_served_from_cache(self, tmp_path):
+        loader = ExcelDataLoader(data_directory=str(tmp_path))
+        first = loader.load_stock_data(write_csv(tmp_path, 'ongc.csv'))
+        
+        entries = list(loader.cache_directory.glob('*.parquet'))
+        assert len(entries) == 1
+        assert not list(loader.cache_directory.glob('*.tmp'))
+        
+        # A marker written into the cached frame proves the source was not re-parsed
+        first.assign(close=-1.0).to_parquet(entries[0])
+        assert (loader.load_stock_data('ongc.csv')['close'] == -1.0).all()
+    
+    def test_modified_source_invalidates_cache(self, tmp_path):
+        loader = ExcelDataLoader(data_directory=str(tmp_path))
+        name = write_csv(tmp_path, 'ongc.csv')
+        loader.load_stock_data(name)
+        
+        write_csv(tmp_path, name, STOCK_CSV.replace('257.10,262.55', '300.00,262.55'))
+        stat = (tmp_path / name).stat()
+        os.utime(tmp_path / name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        
+        assert loader.load_stock_data(name)['close'].iloc[0] == 300.0
+        assert len(list(loader.cache_directory.glob('*.parquet'))) == 2
+    
+    def test_corrupt_entry_is_replaced(self, tmp_path):
+        loader = ExcelDataLoader(data_directory=str(tmp_path))
+        name = write_csv(tmp_path, 'ongc.csv')
+        expected = loader.load_stock_data(name)
+        
+        entry = next(loader.cache_directory.glob('*.parquet'))
+        entry.write_bytes(b'not a parquet file')
+        
+        pd.testing.assert_frame_equal(loader.load_stock_data(name), expected)
+        pd.testing.assert_frame_equal(pd.read_parquet(entry), expected)
+    
+    def test_csv_engine_is_part_of_the_key(self, tmp_path):
+        name = write_csv(tmp_path, 'ongc.csv')
+        ExcelDataLoader(data_directory=str(tmp_path)).load_stock_data(name)
+        loader = ExcelDataLoader(data_directory=str(tmp_path), use_pyarrow=True)
+        loader.load_stock_data(name)
+        
+        assert len(list(loader.cache_directory.glob('*.parquet'))) == 2
+
+
+class TestColumnCoercion:
+    def test_comma_formatted_volumes_are_parsed(self, tmp_path):
+        text = STOCK_CSV.replace('"12,130,001"', '"74,18,162"')
+        loader = ExcelDataLoader(data_directory=str(tmp_path), use_cache=False)
+        stock_df = loader.load_stock_data(write_csv(tmp_path, 'ongc.csv', text))
+        
+        assert stock_df['volume'].tolist() == [8450657.0, 7418162.0, 9004112.0]
+        assert pd.api.types.is_datetime64_any_dtype(stock_df.index)
+    
+    def test_xlsx_numeric_columns_are_kept(self, tmp_path):
+        pytest.importorskip('openpyxl')
+        raw = pd.DataFrame({
+            'Date': pd.to_datetime(['2024-11-11', '2024-11-12']),
+            'Open': [262.35, 257.50],
+            'High': [262.35, 259.90],
+            'Low': [256.00, 251.05],
+            'Close': [257.10, 252.30],
+            'Volume': [8450657, 12130001],
+        })
+        raw.to_excel(tmp_path / 'ongc.xlsx', index=False, engine='openpyxl')
+        loader = ExcelDataLoader(data_directory=str(tmp_path), use_cache=False)
+        stock_df = loader.load_stock_data('ongc.xlsx')
+        
+        assert stock_df['close'].tolist() == [257.10, 252.30]
+        assert stock_df['volume'].tolist() == [8450657, 12130001]
+        assert stock_df.index.tolist() == raw['Date'].tolist()
+
+
+class TestColumnAliases:
+    def test_close_is_preferred_over_prev_close(self):
+        columns = ['Date ', 'Open', 'High', 'Low', 'Prev Close', 'Close', 'Volume']
+        mapping = ExcelDataLoader._resolve_stock_columns(columns)
+        
+        assert mapping['close'] == 'Close'
+        assert mapping['date'] == 'Date '
+    
+    def test_short_aliases_and_substring_fallback(self):
+        columns = ['Timestamp', 'O', 'H', 'L', 'Adj Close', 'Vol']
+        mapping = ExcelDataLoader._resolve_stock_columns(columns)
+        
+        assert mapping == {
+            'date': 'Timestamp', 'open': 'O', 'high': 'H',
+            'low': 'L', 'close': 'Adj Close', 'volume': 'Vol',
+        }
+    
+    def test_missing_column_is_reported(self):
+        with pytest.raises(ValueError, match="'volume' not found"):
+            ExcelDataLoader._resolve_stock_columns(['Date', 'Open', 'High', 'Low', 'Close'])
+    
+    def test_loaded_close_comes_from_close_column(self, tmp_path):
+        loader = ExcelDataLoader(data_directory=str(tmp_path), use_cache=False)
+        stock_df = loader.load_stock_data(write_csv(tmp_path, 'ongc.csv'))
+        
+        assert stock_df['close'].tolist() == [257.10, 252.30, 247.45]
+
+
+class TestStockCsvRead:
+    def test_only_stock_columns_are_read(self, tmp_path):
+        lines = STOCK_CSV.splitlines()
+        text = '\n'.join([lines[0] + ',Series,Note'] + [line + ',EQ,' for line in lines[1:]]) + '\n'
+        loader = ExcelDataLoader(data_directory=str(tmp_path), use_cache=False)
+        raw = loader._load_stock_csv(tmp_path / write_csv(tmp_path, 'ongc.csv', text))
+        
+        assert list(raw.columns) == ['Date ', 'Open', 'High', 'Low', 'Close', 'Volume']
+        assert all(raw[col].dtype == 'float64' for col in ('Open', 'High', 'Low', 'Close'))
+    
+    def test_unparseable_prices_fall_back_to_coercion(self, tmp_path):
+        text = STOCK_CSV.replace('252.00,253.40', '-,253.40')
+        loader = ExcelDataLoader(data_directory=str(tmp_path), use_cache=False)
+        with pytest.warns(UserWarning, match='Removed 1 rows'):
+            stock_df = loader.load_stock_data(write_csv(tmp_path, 'ongc.csv', text))
+        
+        assert stock_df['open'].tolist() == [262.35, 257.50]
+        assert stock_df['close'].tolist() == [257.10, 252.30]
+    
+    def test_unknown_layout_reports_missing_column(self, tmp_path):
+        loader = ExcelDataLoader(data_directory=str(tmp_path), use_cache=False)
+        name = write_csv(tmp_path, 'prices.csv', 'Day,Price\n2024-11-11,1.0\n')
+        
+        with pytest.raises(ValueError, match="'date' not found"):
+            loader.load_stock_data(name)
+
+
+@pytest.mark.skipif(not _HAS_PYARROW, reason="Parquet cache requires pyarrow")
+def test_load_stock_caches_beside_the_data_file(tmp_path, monkeypatch):
+    data_dir = tmp_path / 'prices'
+    data_dir.mkdir()
+    elsewhere = tmp_path / 'elsewhere'
+    elsewhere.mkdir()
+    write_csv(data_dir, 'ongc.csv')
+    monkeypatch.chdir(elsewhere)
+    
+    load_stock(str(data_dir / 'ongc.csv'))
+    
+    assert len(list((data_dir / '.cache').glob('*.parquet'))) == 1
+    assert not (elsewhere / '.cache').exists()